@@ -3,6 +3,7 @@
 
 import argparse
 from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor, wait
 import configparser
 from contextlib import suppress
 from datetime import datetime, timedelta, timezone
@@ -11,6 +12,8 @@ import functools
 import logging
 import logging.config
 from pathlib import Path
+import re
+import shlex
 import subprocess
 import time
 from typing import IO
@@ -25,6 +28,25 @@ from .util import logger_by_class_instance
 _logger = logging.getLogger("autosuspend")
 # pylint: enable=invalid-name
 
+# characters which indicate that a configured command relies on shell features
+_SHELL_SYNTAX = re.compile(r"[|&;<>()$`\\\"'*?\[\]~{}#\n]")
+
+
+def _needs_shell(command: str) -> bool:
+    words = command.split(maxsplit=1)
+    # an empty command or a leading variable assignment needs a shell, too
+    return not words or "=" in words[0] or _SHELL_SYNTAX.search(command) is not None
+
+
+def _run_command(command: str | Sequence[str]) -> None:
+    """Run a configured command and only spawn a shell if it requires one."""
+    if not isinstance(command, str):
+        subprocess.check_call(command)
+    elif _needs_shell(command):
+        subprocess.check_call(command, shell=True)
+    else:
+        subprocess.check_call(shlex.split(command))
+
 
 def execute_suspend(
     command: str | Sequence[str],
@@ -34,8 +56,8 @@ def execute_suspend(
 
     Args:
         command:
-            The command to execute, which will be executed using shell
-            execution
+            The command to execute. Strings using shell syntax will be executed
+            using shell execution.
         wakeup_at:
             potential next wakeup time. Only informative.
     """
@@ -43,8 +65,8 @@ def execute_suspend(
         "Suspending using command: %s with next wake up at %s", command, wakeup_at
     )
     try:
-        subprocess.check_call(command, shell=True)
-    except subprocess.CalledProcessError:
+        _run_command(command)
+    except (subprocess.CalledProcessError, OSError):
         _logger.warning("Unable to execute suspend command: %s", command, exc_info=True)
 
 
@@ -59,14 +81,14 @@ def notify_suspend(
         command_wakeup_template:
             A template for the command to execute in case a wakeup is
             scheduled.
-            It will be executed using shell execution.
+            It will be executed using shell execution if it uses shell syntax.
             The template is processed with string formatting to include
             information on a potentially scheduled wakeup.
             Notifications can be disable by providing ``None`` here.
         command_no_wakeup:
             Command to execute for notification in case no wake up is
             scheduled.
-            Will be executed using shell execution.
+            Will be executed using shell execution if it uses shell syntax.
         wakeup_at:
             if not ``None``, this is the time the system will wake up again
     """
@@ -74,8 +96,8 @@ def notify_suspend(
     def safe_exec(command: str) -> None:
         _logger.info("Notifying using command: %s", command)
         try:
-            subprocess.check_call(command, shell=True)
-        except subprocess.CalledProcessError:
+            _run_command(command)
+        except (subprocess.CalledProcessError, OSError):
             _logger.warning(
                 "Unable to execute notification command: %s", command, exc_info=True
             )
@@ -107,8 +129,8 @@ def schedule_wakeup(command_template: str, wakeup_at: datetime) -> None:
     )
     _logger.info("Scheduling wakeup using command: %s", command)
     try:
-        subprocess.check_call(command, shell=True)
-    except subprocess.CalledProcessError:
+        _run_command(command)
+    except (subprocess.CalledProcessError, OSError):
         _logger.warning(
             "Unable to execute wakeup scheduling command: %s", command, exc_info=True
         )
@@ -123,9 +145,12 @@ def _safe_execute_activity(check: Activity, logger: logging.Logger) -> str | Non
 
 
 def execute_checks(
-    checks: Iterable[Activity], all_checks: bool, logger: logging.Logger
+    checks: Iterable[Activity],
+    all_checks: bool,
+    logger: logging.Logger,
+    executor: Executor | None = None,
 ) -> bool:
-    """Execute the provided checks sequentially.
+    """Execute the provided checks.
 
     Args:
         checks:
@@ -135,10 +160,39 @@ def execute_checks(
             matched.
         logger:
             the logger instance to use
+        executor:
+            if provided and ``all_checks`` is set, the checks are executed
+            concurrently using this executor. Otherwise, checks are executed
+            sequentially in the given order so that evaluation stops at the
+            first match.
 
     Return:
         ``True`` if a check matched
     """
+    if executor is None or not all_checks:
+        return _execute_checks_sequentially(checks, all_checks, logger)
+
+    checks = list(checks)
+    futures = []
+    for check in checks:
+        logger.debug("Executing check %s", check.name)
+        futures.append(executor.submit(_safe_execute_activity, check, logger))
+    # Checks are stateful. Ensure that no check is still running when the next
+    # iteration submits it again, even if one of them raised.
+    wait(futures)
+
+    matched = False
+    for check, future in zip(checks, futures, strict=True):
+        result = future.result()
+        if result is not None:
+            logger.info("Check %s matched. Reason: %s", check.name, result)
+            matched = True
+    return matched
+
+
+def _execute_checks_sequentially(
+    checks: Iterable[Activity], all_checks: bool, logger: logging.Logger
+) -> bool:
     matched = False
     for check in checks:
         logger.debug("Executing check %s", check.name)
@@ -163,12 +217,37 @@ def _safe_execute_wakeup(
 
 
 def execute_wakeups(
-    wakeups: Iterable[Wakeup], timestamp: datetime, logger: logging.Logger
+    wakeups: Iterable[Wakeup],
+    timestamp: datetime,
+    logger: logging.Logger,
+    executor: Executor | None = None,
 ) -> datetime | None:
-    wakeup_at = None
-    for wakeup in wakeups:
-        this_at = _safe_execute_wakeup(wakeup, timestamp, logger)
+    """Determine the earliest scheduled wakeup of the provided checks.
 
+    Args:
+        wakeups:
+            the wakeup checks to execute
+        timestamp:
+            the current time
+        logger:
+            the logger instance to use
+        executor:
+            if provided, the checks are executed concurrently using this
+            executor. Otherwise, checks are executed sequentially.
+
+    Return:
+        the earliest wakeup in the future or ``None`` if no wakeup is required
+    """
+    wakeups = list(wakeups)
+    execute = functools.partial(
+        _safe_execute_wakeup, timestamp=timestamp, logger=logger
+    )
+    results = (
+        map(execute, wakeups) if executor is None else executor.map(execute, wakeups)
+    )
+
+    wakeup_at = None
+    for wakeup, this_at in zip(wakeups, results, strict=True):
         # sanity checks
         if this_at is None:
             continue
@@ -216,6 +295,11 @@ class Processor:
         all_activities:
             if ``True``, execute all activity checks even if a previous one
             already matched.
+
+    In case more than one wakeup check is configured, these checks are
+    executed concurrently using a thread pool owned by the processor. The same
+    applies to activity checks if ``all_activities`` is set. Otherwise,
+    activity checks run sequentially and stop at the first match.
     """
 
     def __init__(
@@ -230,23 +314,37 @@ class Processor:
         all_activities: bool,
     ) -> None:
         self._logger = logger_by_class_instance(self)
-        self._activities = activities
-        self._wakeups = wakeups
+        self._activities = list(activities)
+        self._wakeups = list(wakeups)
         self._idle_time = idle_time
         self._min_sleep_time = min_sleep_time
         self._wakeup_delta = wakeup_delta
         self._sleep_fn = sleep_fn
         self._wakeup_fn = wakeup_fn
         self._all_activities = all_activities
-        self._idle_since = None  # type: datetime | None
+        # POSIX timestamp in seconds
+        self._idle_since = None  # type: float | None
+        self._executor = None  # type: ThreadPoolExecutor | None
+
+    def _executor_for(self, checks: Sequence[Activity | Wakeup]) -> Executor | None:
+        """Lazily create the thread pool shared by activity and wakeup checks."""
+        if len(checks) <= 1:
+            return None
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(len(self._activities), len(self._wakeups)),
+                thread_name_prefix="check",
+            )
+        return self._executor
 
     def _reset_state(self, reason: str) -> None:
         self._logger.info("%s. Resetting state", reason)
         self._idle_since = None
 
-    def _set_idle(self, since: datetime) -> datetime:
-        """Set the idle since marker to the given dt if not already set earlier."""
-        self._idle_since = min(since, self._idle_since or since)
+    def _set_idle(self, since: float) -> float:
+        """Set the idle since marker to the given time if not already set earlier."""
+        if self._idle_since is None or since < self._idle_since:
+            self._idle_since = since
         return self._idle_since
 
     def iteration(self, timestamp: datetime, just_woke_up: bool) -> None:
@@ -258,18 +356,26 @@ class Processor:
             return
 
         # determine system activity
-        active = execute_checks(self._activities, self._all_activities, self._logger)
+        active = execute_checks(
+            self._activities,
+            self._all_activities,
+            self._logger,
+            self._executor_for(self._activities) if self._all_activities else None,
+        )
         self._logger.debug("All activity checks have been executed. Active: %s", active)
         if active:
             self._reset_state("System is active")
             return
 
         # set idle timestamp if required
-        idle_since = self._set_idle(timestamp)
-        self._logger.info("System is idle since %s", idle_since)
+        now = timestamp.timestamp()
+        idle_since = self._set_idle(now)
+        self._logger.info(
+            "System is idle since %s", datetime.fromtimestamp(idle_since, timezone.utc)
+        )
 
         # determine if systems is idle long enough
-        idle_seconds = (timestamp - idle_since).total_seconds()
+        idle_seconds = now - idle_since
         self._logger.debug("Idle seconds: %s", idle_seconds)
         if idle_seconds <= self._idle_time:
             self._logger.info(
@@ -282,7 +388,12 @@ class Processor:
         self._logger.info("System is idle long enough.")
 
         # determine potential wake ups
-        wakeup_at = execute_wakeups(self._wakeups, timestamp, self._logger)
+        wakeup_at = execute_wakeups(
+            self._wakeups,
+            timestamp,
+            self._logger,
+            self._executor_for(self._wakeups),
+        )
         if wakeup_at is None:
             self._logger.debug("No automatic wakeup required")
         else:
@@ -570,8 +681,8 @@ def parse_arguments(args: Sequence[str] | None) -> argparse.Namespace:
         default=False,
         action="store_true",
         help="Execute all checks even if one has already prevented "
-        "the system from going to sleep. Useful to debug individual "
-        "checks.",
+        "the system from going to sleep. The checks are then executed "
+        "concurrently. Useful to debug individual checks.",
     )
     parser_daemon.add_argument(
         "-r",
@@ -13,9 +13,12 @@ from . import (
 
 
 def raise_severe_if_command_not_found(error: subprocess.CalledProcessError) -> None:
-    if error.returncode == 127:
-        # see http://tldp.org/LDP/abs/html/exitcodes.html
-        raise SevereCheckError(f"Command '{' '.join(error.cmd)}' does not exist")
+    # see http://tldp.org/LDP/abs/html/exitcodes.html
+    if error.returncode != 127:
+        return
+
+    command = error.cmd if isinstance(error.cmd, str) else " ".join(error.cmd)
+    raise SevereCheckError(f"Command '{command}' does not exist")
 
 
 class CommandMixin:
@@ -1,14 +1,17 @@
 from collections.abc import Iterable, Sequence
 from contextlib import suppress
+import copy
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta, timezone, tzinfo
+import functools
+import heapq
 from io import BytesIO
+from operator import attrgetter
 from typing import Any, cast, IO, TypeVar
 
 from dateutil.rrule import rrule, rruleset, rrulestr
 import icalendar
 import icalendar.cal
-import pytz
 import tzlocal
 
 from . import Activity, Wakeup
@@ -21,7 +24,7 @@ with suppress(AttributeError):
     icalendar.use_pytz()
 
 
-@dataclass
+@dataclass(slots=True)
 class CalendarEvent:
     summary: str
     start: datetime | date
@@ -33,6 +36,21 @@ class CalendarEvent:
         )
 
 
+_event_start = attrgetter("start")
+
+
+def _ends_before(rules: rruleset, point: datetime) -> bool:
+    """Check whether all occurrences of an rruleset are before the given time.
+
+    Expanding a series always walks through all of its occurrences starting at
+    the first one. Knowing that a series has ended already avoids this walk.
+    """
+    return not rules._rdate and all(  # type: ignore
+        rule._until is not None and rule._until < point
+        for rule in rules._rrule  # type: ignore
+    )
+
+
 def _expand_rrule_all_day(
     rrule: str, start: date, exclusions: Iterable, start_at: datetime, end_at: datetime
 ) -> Iterable[date]:
@@ -41,23 +59,40 @@ def _expand_rrule_all_day(
     To my mind, these events cannot have changes, just exclusions, because
     changes only affect the time, which doesn't exist for all-day events.
     """
+    # reduce start and end to datetimes without timezone that just represent a
+    # date at midnight.
+    window_start = datetime.combine(start_at.date(), datetime.min.time())
+    window_end = datetime.combine(end_at.date(), datetime.min.time())
+
+    # the series starts after the requested window
+    if start > window_end.date():
+        return []
+
     rules = cast(rruleset, rrulestr(rrule, dtstart=start, ignoretz=True, forceset=True))
 
+    # the series ended before the requested window
+    if _ends_before(rules, window_start):
+        return []
+
     # add exclusions
     if exclusions:
         for xdate in exclusions:
             rules.exdate(datetime.combine(xdate.dts[0].dt, datetime.min.time()))
 
-    dates = []
-    # reduce start and end to datetimes without timezone that just represent a
-    # date at midnight.
-    for candidate in rules.between(
-        datetime.combine(start_at.date(), datetime.min.time()),
-        datetime.combine(end_at.date(), datetime.min.time()),
-        inc=True,
-    ):
-        dates.append(candidate.date())
-    return dates
+    return [
+        candidate.date()
+        for candidate in rules.between(window_start, window_end, inc=True)
+    ]
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_rrule(rule: str, start: datetime) -> rrule:
+    """Parse an rrule string.
+
+    Calendars are polled repeatedly, mostly containing the same rules. Therefore,
+    parsed rules are cached. The returned objects must not be modified.
+    """
+    return cast(rrule, rrulestr(rule, dtstart=start, ignoretz=True, forceset=False))
 
 
 def _prepare_rruleset_for_expanding(
@@ -75,15 +110,15 @@ def _prepare_rruleset_for_expanding(
     start = to_tz_unaware(start, tz)
 
     rules = rruleset()
-    first_rule = cast(
-        rrule, rrulestr(rule, dtstart=start, ignoretz=True, forceset=False)
-    )
+    # The parsed rule is shared through the cache. Work on a copy because the
+    # until part is modified below.
+    first_rule = copy.copy(_parse_rrule(rule, start))
 
     # apply the same timezone logic for the until part of the rule after
-    # parsing it.
+    # parsing it. UTC has no DST, so attaching it directly is sufficient.
     if first_rule._until:  # type: ignore
         first_rule._until = to_tz_unaware(  # type: ignore
-            pytz.utc.localize(first_rule._until),  # type: ignore
+            first_rule._until.replace(tzinfo=timezone.utc),  # type: ignore
             tz,
         )
 
@@ -94,7 +129,7 @@ def _prepare_rruleset_for_expanding(
         for xdate in exclusions:
             with suppress(AttributeError):
                 # also in this case, unify and strip the timezone
-                rules.exdate(xdate.dts[0].dt.astimezone(tz).replace(tzinfo=None))
+                rules.exdate(to_tz_unaware(xdate.dts[0].dt, tz))
 
     # add events that were changed
     for change in changes:
@@ -119,27 +154,42 @@ def _expand_rrule(
     start_at = to_tz_unaware(start_at, orig_tz)
     end_at = to_tz_unaware(end_at, orig_tz)
 
+    # the series starts after the requested window
+    if to_tz_unaware(start, orig_tz) > end_at:
+        return []
+
     rules = _prepare_rruleset_for_expanding(rrule, start, exclusions, changes, orig_tz)
 
+    # the series ended before the requested window
+    if _ends_before(rules, start_at - instance_duration):
+        return []
+
     # expand the rrule
-    dates = []
-    for candidate in rules.between(start_at - instance_duration, end_at, inc=True):
-        localized = _localize(candidate, orig_tz)
-        dates.append(localized)
-    return dates
+    return [
+        _localize(candidate, orig_tz)
+        for candidate in rules.between(start_at - instance_duration, end_at, inc=True)
+    ]
 
 
 ChangeMapping = dict[str, list[icalendar.cal.Event]]
 
 
-def _collect_recurrence_changes(calendar: icalendar.Calendar) -> ChangeMapping:
+def _collect_components(
+    calendar: icalendar.Calendar,
+) -> tuple[list[icalendar.cal.Event], ChangeMapping]:
+    """Collect all events and the changes to recurring events in a single walk.
+
+    Changed instances of recurring events are part of both results: they are
+    reported as individual events and need to be excluded when expanding the
+    recurrence they belong to.
+    """
+    components = []
     recurring_changes: ChangeMapping = {}
     for component in calendar.walk("VEVENT"):
+        components.append(component)
         if component.get("recurrence-id"):
-            if component.get("uid") not in recurring_changes:
-                recurring_changes[component.get("uid")] = []
-            recurring_changes[component.get("uid")].append(component)
-    return recurring_changes
+            recurring_changes.setdefault(component.get("uid"), []).append(component)
+    return components, recurring_changes
 
 
 def _get_recurrence_exclusions_as_list(component: dict) -> list:
@@ -232,6 +282,7 @@ def _extract_events_from_component(
     recurring_changes: ChangeMapping,
     start_at: datetime,
     end_at: datetime,
+    local_tz: Any,
 ) -> list[CalendarEvent]:
     start = component.get("dtstart").dt
     end = component.get("dtend").dt
@@ -241,9 +292,8 @@ def _extract_events_from_component(
     # datetimes.
     if isinstance(start, datetime) and not is_aware(start):
         assert not is_aware(end)
-        local_time = tzlocal.get_localzone()
-        start = _localize(start, local_time)
-        end = _localize(end, local_time)
+        start = _localize(start, local_tz)
+        end = _localize(end, local_tz)
 
     if component.get("rrule"):
         return _extract_events_from_recurring_component(
@@ -255,6 +305,23 @@ def _extract_events_from_component(
         )
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_calendar(
+    data: bytes,
+) -> tuple[list[icalendar.cal.Event], ChangeMapping]:
+    """Parse icalendar data into its events and the changes to recurring events.
+
+    Calendars are usually polled repeatedly without being modified in between.
+    Therefore, the parsed results are cached based on the raw data. The returned
+    objects are shared and must not be modified.
+    """
+    calendar: icalendar.Calendar = icalendar.Calendar.from_ical(data)
+
+    # Collect all changes to recurring events before processing any event so
+    # that they can be handled when expanding recurrences.
+    return _collect_components(calendar)
+
+
 def list_calendar_events(
     data: IO[bytes], start_at: datetime, end_at: datetime
 ) -> Sequence[CalendarEvent]:
@@ -272,21 +339,27 @@ def list_calendar_events(
     # * end times and dates are non-inclusive for ical events
     # * start and end are dates for all-day events
 
-    calendar: icalendar.Calendar = icalendar.Calendar.from_ical(data.read())
+    components, recurring_changes = _parse_calendar(data.read())
 
-    # Do a first pass through the calendar to collect all exclusions to
-    # recurring events so that they can be handled when expanding recurrences.
-    recurring_changes = _collect_recurrence_changes(calendar)
+    # Floating events are interpreted in the local timezone. Determine it only
+    # once instead of for every event.
+    local_tz = tzlocal.get_localzone()
 
-    events = []
-    for component in calendar.walk("VEVENT"):
-        events.extend(
-            _extract_events_from_component(
-                component, recurring_changes, start_at, end_at
-            )
+    # Expanded recurrences are already sorted. Only the single events need to be
+    # sorted before merging everything.
+    single_events = []
+    series = []
+    for component in components:
+        events = _extract_events_from_component(
+            component, recurring_changes, start_at, end_at, local_tz
         )
+        if len(events) > 1:
+            series.append(events)
+        else:
+            single_events.extend(events)
+    single_events.sort(key=_event_start)
 
-    return sorted(events, key=lambda e: e.start)
+    return list(heapq.merge(single_events, *series, key=_event_start))
 
 
 class ActiveCalendarEvent(NetworkMixin, Activity):
@@ -44,7 +44,7 @@ class ActiveConnection(Activity):
 
     def __init__(self, name: str, ports: Iterable[int]) -> None:
         Activity.__init__(self, name)
-        self._ports = ports
+        self._ports = frozenset(ports)
 
     def normalize_address(
         self, family: socket.AddressFamily, address: str
@@ -61,20 +61,22 @@ class ActiveConnection(Activity):
 
     def check(self) -> str | None:
         # Find the addresses of the system
-        own_addresses = [
+        own_addresses = {
             self.normalize_address(item.family, item.address)
             for sublist in psutil.net_if_addrs().values()
             for item in sublist
-        ]
-        # Find established connections to target ports
+        }
+        # Find established connections to target ports. Cheap comparisons come
+        # first so that only candidate connections get their address normalized.
+        # Only TCP has an ESTABLISHED state, UDP sockets do not need to be listed.
         connected = [
             connection.laddr[1]
-            for connection in psutil.net_connections()
+            for connection in psutil.net_connections(kind="tcp")
             if (
-                self.normalize_address(connection.family, connection.laddr[0])
-                in own_addresses
-                and connection.status == "ESTABLISHED"
+                connection.status == "ESTABLISHED"
                 and connection.laddr[1] in self._ports
+                and self.normalize_address(connection.family, connection.laddr[0])
+                in own_addresses
             )
         ]
         if connected:
@@ -155,38 +157,31 @@ class NetworkBandwidth(Activity):
         self._previous_values = psutil.net_io_counters(pernic=True)
         self._previous_time = time.time()
 
-    @classmethod
-    def _rate(cls, new: float, old: float, new_time: float, old_time: float) -> float:
-        delta = new - old
-        return delta / (new_time - old_time)
-
-    class _InterfaceActive(RuntimeError):
-        pass
-
     def _check_interface(
         self,
         interface: str,
         new: psutil._common.snetio,
         old: psutil._common.snetio,
-        new_time: float,
-        old_time: float,
-    ) -> None:
+        elapsed: float,
+    ) -> str | None:
         # send direction
-        rate_send = self._rate(new.bytes_sent, old.bytes_sent, new_time, old_time)
+        rate_send = (new.bytes_sent - old.bytes_sent) / elapsed
         if rate_send > self._threshold_send:
-            raise self._InterfaceActive(
+            return (
                 f"Interface {interface} sending rate {rate_send} byte/s "
                 f"higher than threshold {self._threshold_send}"
             )
 
         # receive direction
-        rate_receive = self._rate(new.bytes_recv, old.bytes_recv, new_time, old_time)
+        rate_receive = (new.bytes_recv - old.bytes_recv) / elapsed
         if rate_receive > self._threshold_receive:
-            raise self._InterfaceActive(
+            return (
                 f"Interface {interface} receive rate {rate_receive} byte/s "
                 f"higher than threshold {self._threshold_receive}"
             )
 
+        return None
+
     def check(self) -> str | None:
         # acquire the previous state and preserve it
         old_values = self._previous_values
@@ -199,21 +194,17 @@ class NetworkBandwidth(Activity):
         if new_time <= self._previous_time:
             raise TemporaryCheckError("Called too fast, no time between calls")
         self._previous_time = new_time
+        elapsed = new_time - old_time
 
         for interface in self._interfaces:
-            if interface not in new_values or interface not in self._previous_values:
+            if interface not in new_values or interface not in old_values:
                 raise TemporaryCheckError(f"Interface {interface} is missing")
 
-            try:
-                self._check_interface(
-                    interface,
-                    new_values[interface],
-                    old_values[interface],
-                    new_time,
-                    old_time,
-                )
-            except self._InterfaceActive as e:
-                return str(e)
+            active = self._check_interface(
+                interface, new_values[interface], old_values[interface], elapsed
+            )
+            if active is not None:
+                return active
 
         return None
 
@@ -267,7 +258,7 @@ class Processes(Activity):
 
     def __init__(self, name: str, processes: Iterable[str]) -> None:
         Activity.__init__(self, name)
-        self._processes = processes
+        self._processes = frozenset(processes)
 
     def check(self) -> str | None:
         for proc in psutil.process_iter():
@@ -342,11 +333,20 @@ class File(Wakeup):
     def __init__(self, name: str, path: Path) -> None:
         Wakeup.__init__(self, name)
         self._path = path
+        # modification time and size of the last read file and the parsed result
+        self._cached: tuple[tuple[int, int], datetime] | None = None
 
     def check(self, timestamp: datetime) -> datetime | None:  # noqa: ARG002
         try:
+            stat = self._path.stat()
+            key = (stat.st_mtime_ns, stat.st_size)
+            if self._cached is not None and self._cached[0] == key:
+                return self._cached[1]
+
             first_line = self._path.read_text().splitlines()[0]
-            return datetime.fromtimestamp(float(first_line.strip()), timezone.utc)
+            result = datetime.fromtimestamp(float(first_line.strip()), timezone.utc)
+            self._cached = (key, result)
+            return result
         except FileNotFoundError:
             # this is ok
             return None
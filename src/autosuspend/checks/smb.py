@@ -1,4 +1,5 @@
 import configparser
+import shutil
 import subprocess
 
 from . import Activity, SevereCheckError, TemporaryCheckError
@@ -11,28 +12,34 @@ class Smb(Activity):
     ) -> "Smb":
         return cls(name)
 
+    def __init__(self, name: str) -> None:
+        Activity.__init__(self, name)
+        # resolve the binary once instead of searching PATH on every call
+        self._smbstatus = shutil.which("smbstatus") or "smbstatus"
+
     def _safe_get_status(self) -> str:
         try:
-            return subprocess.check_output(["smbstatus", "-b"]).decode("utf-8")
+            return subprocess.check_output([self._smbstatus, "-b"]).decode("utf-8")
         except FileNotFoundError as error:
             raise SevereCheckError("smbstatus binary not found") from error
         except subprocess.CalledProcessError as error:
             raise TemporaryCheckError("Unable to execute smbstatus") from error
 
+    @staticmethod
+    def _parse_connections(status_output: str) -> list[str]:
+        """Extract the connection lines following the smbstatus table header."""
+        lines = iter(status_output.splitlines())
+        for line in lines:
+            if line.startswith("----"):
+                break
+        return list(lines)
+
     def check(self) -> str | None:
         status_output = self._safe_get_status()
 
         self.logger.debug("Received status output:\n%s", status_output)
 
-        connections = []
-        start_seen = False
-        for line in status_output.splitlines():
-            if start_seen:
-                connections.append(line)
-            else:
-                if line.startswith("----"):
-                    start_seen = True
-
+        connections = self._parse_connections(status_output)
         if connections:
             return "SMB clients are connected:\n{}".format("\n".join(connections))
         else:
@@ -1,6 +1,7 @@
 from collections.abc import Iterable
 import configparser
 from datetime import datetime, timedelta, timezone
+import functools
 import re
 from re import Pattern
 from typing import Any
@@ -8,18 +9,37 @@ from typing import Any
 import dbus
 
 from . import Activity, ConfigurationError, TemporaryCheckError, Wakeup
+from ..util import systemd as util_systemd
 from ..util.systemd import list_logind_sessions, LogindDBusException
 
 
 _UINT64_MAX = 18446744073709551615
 
 
+@functools.lru_cache(maxsize=1)
+def _systemd1(bus: dbus.SystemBus) -> dbus.proxies.ProxyObject:
+    """Return the proxy of the systemd manager object on the given bus."""
+    return bus.get_object("org.freedesktop.systemd1", "/org/freedesktop/systemd1")
+
+
 def next_timer_executions() -> dict[str, datetime]:
-    bus = dbus.SystemBus()
+    try:
+        return _next_timer_executions()
+    except dbus.exceptions.DBusException:
+        # do not keep a proxy that might be broken for the next attempt
+        _systemd1.cache_clear()
+        raise
+
+
+def _next_timer_executions() -> dict[str, datetime]:
+    bus = util_systemd.get_bus()
 
-    systemd = bus.get_object("org.freedesktop.systemd1", "/org/freedesktop/systemd1")
-    units = systemd.ListUnits(dbus_interface="org.freedesktop.systemd1.Manager")
-    timers = [unit for unit in units if unit[0].endswith(".timer")]
+    systemd = _systemd1(bus)
+    # Let systemd filter the units instead of transferring all of them. An empty
+    # list of states selects units in any state.
+    timers = systemd.ListUnitsByPatterns(
+        [], ["*.timer"], dbus_interface="org.freedesktop.systemd1.Manager"
+    )
 
     def get_if_set(props: dict[str, Any], key: str) -> int | None:
         # For timers running after boot, next execution time might not be available. In
@@ -69,7 +89,10 @@ class SystemdTimer(Wakeup):
         self._match = match
 
     def check(self, timestamp: datetime) -> datetime | None:  # noqa: ARG002
-        executions = next_timer_executions()
+        try:
+            executions = next_timer_executions()
+        except dbus.exceptions.DBusException as error:
+            raise TemporaryCheckError(error) from error
         matching_executions = [
             next_run for name, next_run in executions.items() if self._match.match(name)
         ]
@@ -79,6 +102,10 @@ class SystemdTimer(Wakeup):
             return None
 
 
+def _split_list(value: str) -> list[str]:
+    return [v.strip() for v in value.split(",")]
+
+
 class LogindSessionsIdle(Activity):
     """Prevents suspending in case a logind session is marked not idle.
 
@@ -91,12 +118,9 @@ class LogindSessionsIdle(Activity):
         name: str,
         config: configparser.SectionProxy,
     ) -> "LogindSessionsIdle":
-        types = config.get("types", fallback="tty,x11,wayland").split(",")
-        types = [t.strip() for t in types]
-        states = config.get("states", fallback="active,online").split(",")
-        states = [t.strip() for t in states]
-        classes = config.get("classes", fallback="user").split(",")
-        classes = [t.strip() for t in classes]
+        types = _split_list(config.get("types", fallback="tty,x11,wayland"))
+        states = _split_list(config.get("states", fallback="active,online"))
+        classes = _split_list(config.get("classes", fallback="user"))
         return cls(name, types, states, classes)
 
     def __init__(
@@ -104,7 +128,7 @@ class LogindSessionsIdle(Activity):
         name: str,
         types: Iterable[str],
         states: Iterable[str],
-        classes: Iterable[str] = ("user"),
+        classes: Iterable[str] = ("user",),
     ) -> None:
         Activity.__init__(self, name)
         self._types = types
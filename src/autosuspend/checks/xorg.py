@@ -3,9 +3,11 @@ import configparser
 from contextlib import suppress
 import copy
 from dataclasses import dataclass
+import functools
 import logging
 import os
 from pathlib import Path
+import pwd
 import re
 from re import Pattern
 import subprocess
@@ -26,6 +28,11 @@ class XorgSession:
 _logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def _user_name(uid: int) -> str:
+    return pwd.getpwuid(uid).pw_name
+
+
 def list_sessions_sockets(socket_path: Path | None = None) -> list[XorgSession]:
     """List running X sessions by iterating the X sockets.
 
@@ -33,8 +40,13 @@ def list_sessions_sockets(socket_path: Path | None = None) -> list[XorgSession]:
     server.
     """
     folder = socket_path or Path("/tmp/.X11-unix/")  # noqa: S108 expected default path
-    sockets = folder.glob("X*")
-    _logger.debug("Found sockets: %s", sockets)
+    try:
+        with os.scandir(folder) as entries:
+            sockets = [entry for entry in entries if entry.name.startswith("X")]
+    except OSError:
+        # like Path.glob, treat a missing or unreadable folder as empty
+        sockets = []
+    _logger.debug("Found sockets: %s", [sock.name for sock in sockets])
 
     results = []
     for sock in sockets:
@@ -44,18 +56,18 @@ def list_sessions_sockets(socket_path: Path | None = None) -> list[XorgSession]:
         except ValueError:
             _logger.warning(
                 "Cannot parse display number from socket %s. Skipping.",
-                sock,
+                sock.path,
                 exc_info=True,
             )
             continue
 
         # determine the user of the display
         try:
-            user = sock.owner()
+            user = _user_name(sock.stat().st_uid)
         except (FileNotFoundError, KeyError):
             _logger.warning(
                 "Cannot get the owning user from socket %s. Skipping.",
-                sock,
+                sock.path,
                 exc_info=True,
             )
             continue
@@ -114,8 +126,8 @@ class XIdleTime(Activity):
                     name,
                     config.getint("timeout", fallback=600),
                     config.get("method", fallback="sockets"),
-                    re.compile(config.get("ignore_if_process", fallback=r"a^")),
-                    re.compile(config.get("ignore_users", fallback=r"a^")),
+                    cls._compile_optional(config.get("ignore_if_process")),
+                    cls._compile_optional(config.get("ignore_users")),
                 )
             except re.error as error:
                 raise ConfigurationError(
@@ -126,6 +138,10 @@ class XIdleTime(Activity):
                     f"Unable to parse configuration: {error}",
                 ) from error
 
+    @staticmethod
+    def _compile_optional(pattern: str | None) -> Pattern | None:
+        return re.compile(pattern) if pattern is not None else None
+
     @staticmethod
     def _get_session_method(method: str) -> Callable[[], list[XorgSession]]:
         if method == "sockets":
@@ -140,8 +156,8 @@ class XIdleTime(Activity):
         name: str,
         timeout: float,
         method: str,
-        ignore_process_re: Pattern,
-        ignore_users_re: Pattern,
+        ignore_process_re: Pattern | None,
+        ignore_users_re: Pattern | None,
     ) -> None:
         Activity.__init__(self, name)
         self._timeout = timeout
@@ -162,6 +178,10 @@ class XIdleTime(Activity):
         return user_processes
 
     def _is_skip_process_running(self, user: str) -> bool:
+        # avoid iterating all processes if nothing can match
+        if self._ignore_process_re is None:
+            return False
+
         for process in self._get_user_processes(user):
             if self._ignore_process_re.match(process) is not None:
                 self.logger.debug(
@@ -206,7 +226,10 @@ class XIdleTime(Activity):
             self.logger.info("Checking session %s", session)
 
             # check whether this users should be ignored completely
-            if self._ignore_users_re.match(session.user) is not None:
+            if (
+                self._ignore_users_re is not None
+                and self._ignore_users_re.match(session.user) is not None
+            ):
                 self.logger.debug("Skipping user '%s' due to request", session.user)
                 continue
 
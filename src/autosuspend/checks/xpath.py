@@ -36,6 +36,8 @@ class XPathMixin(NetworkMixin):
     def __init__(self, xpath: str, **kwargs: Any) -> None:
         NetworkMixin.__init__(self, **kwargs)
         self._xpath = xpath
+        # compile once instead of on every evaluation
+        self._compiled_xpath = XPath(xpath)
 
         self._parser = etree.XMLParser(resolve_entities=False)
 
@@ -43,7 +45,7 @@ class XPathMixin(NetworkMixin):
         try:
             reply = self.request().content
             root = etree.fromstring(reply, parser=self._parser)  # noqa: S320
-            return root.xpath(self._xpath)
+            return self._compiled_xpath(root)
         except requests.exceptions.RequestException as error:
             raise TemporaryCheckError(error) from error
         except etree.XMLSyntaxError as error:
@@ -1,17 +1,29 @@
 from collections.abc import Iterable
+import functools
 from typing import TYPE_CHECKING
 
 
 if TYPE_CHECKING:
     import dbus
+    import dbus.proxies
 
 
-def _get_bus() -> "dbus.SystemBus":
+def get_bus() -> "dbus.SystemBus":
     import dbus
 
     return dbus.SystemBus()
 
 
+@functools.lru_cache(maxsize=1)
+def _login1(bus: "dbus.SystemBus") -> "dbus.proxies.ProxyObject":
+    """Return the proxy of the logind manager object on the given bus.
+
+    ``dbus.SystemBus`` already returns a shared connection. Hence, the proxy is
+    only looked up once per connection.
+    """
+    return bus.get_object("org.freedesktop.login1", "/org/freedesktop/login1")
+
+
 class LogindDBusException(RuntimeError):
     """Indicates an error communicating to Logind via DBus."""
 
@@ -27,8 +39,8 @@ def list_logind_sessions() -> Iterable[tuple[str, dict]]:
     import dbus
 
     try:
-        bus = _get_bus()
-        login1 = bus.get_object("org.freedesktop.login1", "/org/freedesktop/login1")
+        bus = get_bus()
+        login1 = _login1(bus)
 
         sessions = login1.ListSessions(dbus_interface="org.freedesktop.login1.Manager")
 
@@ -41,6 +53,7 @@ def list_logind_sessions() -> Iterable[tuple[str, dict]]:
             properties = properties_interface.GetAll("org.freedesktop.login1.Session")
             results.append((session_id, properties))
     except dbus.exceptions.DBusException as error:
+        _login1.cache_clear()
         raise LogindDBusException(error) from error
 
     return results
@@ -65,38 +65,48 @@ def serve_protected(httpserver: HTTPServer) -> Callable[[Path], tuple[str, str,
     return serve
 
 
-@pytest.fixture
-def logind(
-    monkeypatch: Any,
-    dbusmock_system: PrivateDBus,  # noqa
-) -> Iterable[ProxyObject]:
+@pytest.fixture(scope="session")
+def _dbusmock_requirements() -> None:
+    """Skip tests requiring a mocked DBus if its dependencies are missing."""
     pytest.importorskip("dbus")
     pytest.importorskip("gi")
 
-    with dbusmock.SpawnedMock.spawn_with_template("logind") as server:
 
-        def get_bus() -> Bus:
-            return dbusmock_system.bustype.get_connection()
+@pytest.fixture(scope="session")
+def _logind_server(
+    _dbusmock_requirements: None,
+    dbusmock_system: PrivateDBus,  # noqa
+) -> Iterable[dbusmock.SpawnedMock]:
+    """Spawn a single mocked logind for the whole test session."""
+    with dbusmock.SpawnedMock.spawn_with_template("logind") as server:
+        yield server
 
-        monkeypatch.setattr(util_systemd, "_get_bus", get_bus)
 
-        yield server.obj
+@pytest.fixture
+def logind(
+    monkeypatch: Any,
+    _logind_server: dbusmock.SpawnedMock,
+    dbusmock_system: PrivateDBus,  # noqa
+) -> ProxyObject:
+    # restore the template state left behind by previous tests
+    _logind_server.obj.Reset(dbus_interface=dbusmock.MOCK_IFACE)
 
+    def get_bus() -> Bus:
+        return dbusmock_system.bustype.get_connection()
 
-@pytest.fixture
-def _logind_dbus_error(
-    monkeypatch: Any, dbusmock_system: PrivateDBus  # noqa
-) -> Iterable[None]:
-    pytest.importorskip("dbus")
-    pytest.importorskip("gi")
+    monkeypatch.setattr(util_systemd, "get_bus", get_bus)
 
-    with dbusmock.SpawnedMock.spawn_with_template("logind"):
+    return _logind_server.obj
 
-        def get_bus() -> Bus:
-            import dbus
 
-            raise dbus.exceptions.ValidationException("Test")
+@pytest.fixture
+def _logind_dbus_error(
+    monkeypatch: Any,
+    _logind_server: dbusmock.SpawnedMock,
+) -> None:
+    def get_bus() -> Bus:
+        import dbus
 
-        monkeypatch.setattr(util_systemd, "_get_bus", get_bus)
+        raise dbus.exceptions.ValidationException("Test")
 
-        yield
+    monkeypatch.setattr(util_systemd, "get_bus", get_bus)
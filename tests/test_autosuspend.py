@@ -1,4 +1,5 @@
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 import configparser
 from datetime import datetime, timedelta, timezone
 import logging
@@ -11,12 +12,34 @@ from pytest_mock import MockerFixture
 
 import autosuspend
 
+from .utils import config_parser
+
 
 class TestExecuteSuspend:
     def test_smoke(self, mocker: MockerFixture) -> None:
         mock = mocker.patch("subprocess.check_call")
         command = ["foo", "bar"]
         autosuspend.execute_suspend(command, None)
+        mock.assert_called_once_with(command)
+
+    def test_plain_command_without_shell(self, mocker: MockerFixture) -> None:
+        mock = mocker.patch("subprocess.check_call")
+        autosuspend.execute_suspend("/usr/bin/systemctl suspend", None)
+        mock.assert_called_once_with(["/usr/bin/systemctl", "suspend"])
+
+    @pytest.mark.parametrize(
+        "command",
+        [
+            "echo mem > /sys/power/state",
+            "systemctl suspend || pm-suspend",
+            "FOO=bar suspend",
+            "echo $HOME",
+            "",
+        ],
+    )
+    def test_shell_syntax_uses_shell(self, mocker: MockerFixture, command: str) -> None:
+        mock = mocker.patch("subprocess.check_call")
+        autosuspend.execute_suspend(command, None)
         mock.assert_called_once_with(command, shell=True)
 
     def test_call_exception(self, mocker: MockerFixture) -> None:
@@ -28,7 +51,14 @@ class TestExecuteSuspend:
 
         autosuspend.execute_suspend(command, None)
 
-        mock.assert_called_once_with(command, shell=True)
+        mock.assert_called_once_with(command)
+        assert spy.call_count == 1
+
+    def test_missing_executable(self, mocker: MockerFixture) -> None:
+        spy = mocker.spy(autosuspend._logger, "warning")
+
+        autosuspend.execute_suspend("thisreallydoesnotexist", None)
+
         assert spy.call_count == 1
 
 
@@ -38,7 +68,7 @@ class TestScheduleWakeup:
         dt = datetime.fromtimestamp(1525270801, timezone(timedelta(hours=4)))
         autosuspend.schedule_wakeup("echo {timestamp:.0f} {iso}", dt)
         mock.assert_called_once_with(
-            "echo 1525270801 2018-05-02T18:20:01+04:00", shell=True
+            ["echo", "1525270801", "2018-05-02T18:20:01+04:00"]
         )
 
     def test_call_exception(self, mocker: MockerFixture) -> None:
@@ -49,7 +79,7 @@ class TestScheduleWakeup:
 
         autosuspend.schedule_wakeup("foo", datetime.now(timezone.utc))
 
-        mock.assert_called_once_with("foo", shell=True)
+        mock.assert_called_once_with(["foo"])
         assert spy.call_count == 1
 
 
@@ -94,8 +124,7 @@ class TestSetUpChecks:
             spec=autosuspend.checks.Activity
         )
 
-        parser = configparser.ConfigParser()
-        parser.read_string(
+        parser = config_parser(
             """
             [check.Foo]
             class = Mpd
@@ -114,8 +143,7 @@ class TestSetUpChecks:
         mock_class.create.return_value = mocker.MagicMock(
             spec=autosuspend.checks.Activity
         )
-        parser = configparser.ConfigParser()
-        parser.read_string(
+        parser = config_parser(
             """
             [check.Foo]
             class = os.path.TestCheck
@@ -133,8 +161,7 @@ class TestSetUpChecks:
         mock_class = mocker.patch("autosuspend.checks.activity.Mpd")
         mock_class.create.return_value = mocker.MagicMock(spec=autosuspend.Activity)
 
-        parser = configparser.ConfigParser()
-        parser.read_string(
+        parser = config_parser(
             """
             [check.Foo]
             class = Mpd
@@ -164,8 +191,7 @@ class TestSetUpChecks:
         mock_xidletime = mocker.patch("autosuspend.checks.activity.XIdleTime")
         mock_xidletime.create.return_value = mocker.MagicMock(spec=autosuspend.Activity)
 
-        parser = configparser.ConfigParser()
-        parser.read_string(
+        parser = config_parser(
             """
             [check.Foo]
             class = Mpd
@@ -189,8 +215,7 @@ class TestSetUpChecks:
         )
 
     def test_no_such_class(self) -> None:
-        parser = configparser.ConfigParser()
-        parser.read_string(
+        parser = config_parser(
             """
             [check.Foo]
             class = FooBarr
@@ -206,8 +231,7 @@ class TestSetUpChecks:
         mock_class = mocker.patch("autosuspend.checks.activity.Mpd")
         mock_class.create.return_value = mocker.MagicMock()
 
-        parser = configparser.ConfigParser()
-        parser.read_string(
+        parser = config_parser(
             """
             [check.Foo]
             class = Mpd
@@ -228,8 +252,7 @@ class TestSetUpChecks:
             spec=autosuspend.checks.Activity
         )
 
-        parser = configparser.ConfigParser()
-        parser.read_string(
+        parser = config_parser(
             """
             [check.Foo]
             class = Mpd
@@ -250,60 +273,67 @@ class TestExecuteChecks:
     def test_no_checks(self, mocker: MockerFixture) -> None:
         assert autosuspend.execute_checks([], False, mocker.MagicMock()) is False
 
-    def test_matches(self, mocker: MockerFixture) -> None:
-        matching_check = mocker.MagicMock(spec=autosuspend.Activity)
-        matching_check.name = "foo"
-        matching_check.check.return_value = "matches"
+    @pytest.mark.parametrize(
+        ("results", "all_checks", "expected_calls"),
+        [
+            (["matches"], False, [1]),
+            (["matches", "matches"], False, [1, 0]),
+            (["matches", "matches"], True, [1, 1]),
+            ([autosuspend.TemporaryCheckError()], False, [1]),
+        ],
+        ids=["matches", "only_first_called", "all_called", "temporary_error"],
+    )
+    def test_matching_checks(
+        self,
+        mocker: MockerFixture,
+        results: list[str | Exception],
+        all_checks: bool,
+        expected_calls: list[int],
+    ) -> None:
+        checks = [
+            (
+                _StubCheck(f"check{i}", None, error=result)
+                if isinstance(result, Exception)
+                else _StubCheck(f"check{i}", result)
+            )
+            for i, result in enumerate(results)
+        ]
+
         assert (
-            autosuspend.execute_checks([matching_check], False, mocker.MagicMock())
-            is True
+            autosuspend.execute_checks(checks, all_checks, mocker.MagicMock()) is True
         )
-        matching_check.check.assert_called_once_with()
+        assert [check.calls for check in checks] == expected_calls
 
-    def test_only_first_called(self, mocker: MockerFixture) -> None:
-        matching_check = mocker.MagicMock(spec=autosuspend.Activity)
-        matching_check.name = "foo"
-        matching_check.check.return_value = "matches"
-        second_check = mocker.MagicMock()
-        second_check.name = "bar"
-        second_check.check.return_value = "matches"
+    def test_executor_unused_without_all_checks(self, mocker: MockerFixture) -> None:
+        checks = [_StubCheck("foo", "matches"), _StubCheck("bar", "matches")]
+        executor = mocker.MagicMock()
 
         assert (
-            autosuspend.execute_checks(
-                [matching_check, second_check], False, mocker.MagicMock()
-            )
+            autosuspend.execute_checks(checks, False, mocker.MagicMock(), executor)
             is True
         )
-        matching_check.check.assert_called_once_with()
-        second_check.check.assert_not_called()
+        assert [check.calls for check in checks] == [1, 0]
+        executor.submit.assert_not_called()
 
-    def test_all_called(self, mocker: MockerFixture) -> None:
-        matching_check = mocker.MagicMock(spec=autosuspend.Activity)
-        matching_check.name = "foo"
-        matching_check.check.return_value = "matches"
-        second_check = mocker.MagicMock()
-        second_check.name = "bar"
-        second_check.check.return_value = "matches"
+    def test_concurrent_no_match(self, mocker: MockerFixture) -> None:
+        checks = [_StubCheck("foo", None), _StubCheck("bar", None)]
 
-        assert (
-            autosuspend.execute_checks(
-                [matching_check, second_check], True, mocker.MagicMock()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            assert (
+                autosuspend.execute_checks(checks, True, mocker.MagicMock(), executor)
+                is False
             )
-            is True
-        )
-        matching_check.check.assert_called_once_with()
-        second_check.check.assert_called_once_with()
+        assert [check.calls for check in checks] == [1, 1]
 
-    def test_treat_temporary_errors_as_activity(self, mocker: MockerFixture) -> None:
-        matching_check = mocker.MagicMock(spec=autosuspend.Activity)
-        matching_check.name = "foo"
-        matching_check.check.side_effect = autosuspend.TemporaryCheckError()
+    def test_concurrent_all_called(self, mocker: MockerFixture) -> None:
+        checks = [_StubCheck("foo", "matches"), _StubCheck("bar", "matches")]
 
-        assert (
-            autosuspend.execute_checks([matching_check], False, mocker.MagicMock())
-            is True
-        )
-        matching_check.check.assert_called_once_with()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            assert (
+                autosuspend.execute_checks(checks, True, mocker.MagicMock(), executor)
+                is True
+            )
+        assert [check.calls for check in checks] == [1, 1]
 
 
 class TestExecuteWakeups:
@@ -316,8 +346,7 @@ class TestExecuteWakeups:
         )
 
     def test_all_none(self, mocker: MockerFixture) -> None:
-        wakeup = mocker.MagicMock(spec=autosuspend.Wakeup)
-        wakeup.check.return_value = None
+        wakeup = _StubWakeup("wakeup")
         assert (
             autosuspend.execute_wakeups(
                 [wakeup], datetime.now(timezone.utc), mocker.MagicMock()
@@ -332,12 +361,10 @@ class TestExecuteWakeups:
     def test_skips_none_outdated_and_continues(
         self, mocker: MockerFixture, illegal: datetime | None
     ) -> None:
-        wakeup_none = mocker.MagicMock(spec=autosuspend.Wakeup)
-        wakeup_none.check.return_value = illegal
+        wakeup_none = _StubWakeup("wakeup_none", illegal)
         now = dateutil.parser.parse("20040705T090000Z")
         wake_up_at = now + timedelta(minutes=10)
-        wakeup_real = mocker.MagicMock(spec=autosuspend.Wakeup)
-        wakeup_real.check.return_value = wake_up_at
+        wakeup_real = _StubWakeup("wakeup_real", wake_up_at)
         assert (
             autosuspend.execute_wakeups(
                 [wakeup_none, wakeup_real],
@@ -346,13 +373,12 @@ class TestExecuteWakeups:
             )
             == wake_up_at
         )
-        assert wakeup_none.check.called
+        assert wakeup_none.calls == 1
 
     def test_basic_return(self, mocker: MockerFixture) -> None:
-        wakeup = mocker.MagicMock(spec=autosuspend.Wakeup)
         now = datetime.now(timezone.utc)
         wakeup_time = now + timedelta(seconds=10)
-        wakeup.check.return_value = wakeup_time
+        wakeup = _StubWakeup("wakeup", wakeup_time)
         assert (
             autosuspend.execute_wakeups([wakeup], now, mocker.MagicMock())
             == wakeup_time
@@ -360,14 +386,11 @@ class TestExecuteWakeups:
 
     def test_soonest_taken(self, mocker: MockerFixture) -> None:
         reference = datetime.now(timezone.utc)
-        wakeup = mocker.MagicMock(spec=autosuspend.Wakeup)
-        wakeup.check.return_value = reference + timedelta(seconds=20)
+        wakeup = _StubWakeup("wakeup", reference + timedelta(seconds=20))
         earlier = reference + timedelta(seconds=10)
-        wakeup_earlier = mocker.MagicMock(spec=autosuspend.Wakeup)
-        wakeup_earlier.check.return_value = earlier
+        wakeup_earlier = _StubWakeup("wakeup_earlier", earlier)
         in_between = reference + timedelta(seconds=15)
-        wakeup_later = mocker.MagicMock(spec=autosuspend.Wakeup)
-        wakeup_later.check.return_value = in_between
+        wakeup_later = _StubWakeup("wakeup_later", in_between)
         assert (
             autosuspend.execute_wakeups(
                 [wakeup, wakeup_earlier, wakeup_later], reference, mocker.MagicMock()
@@ -375,23 +398,41 @@ class TestExecuteWakeups:
             == earlier
         )
 
+    def test_soonest_taken_concurrently(self, mocker: MockerFixture) -> None:
+        reference = datetime.now(timezone.utc)
+        wakeup = _StubWakeup("wakeup", reference + timedelta(seconds=20))
+        earlier = reference + timedelta(seconds=10)
+        wakeup_earlier = _StubWakeup("wakeup_earlier", earlier)
+        wakeup_error = _StubWakeup(
+            "wakeup_error", error=autosuspend.TemporaryCheckError()
+        )
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            assert (
+                autosuspend.execute_wakeups(
+                    [wakeup, wakeup_earlier, wakeup_error],
+                    reference,
+                    mocker.MagicMock(),
+                    executor,
+                )
+                == earlier
+            )
+
     def test_ignore_temporary_errors(self, mocker: MockerFixture) -> None:
         now = datetime.now(timezone.utc)
 
-        wakeup = mocker.MagicMock(spec=autosuspend.Wakeup)
-        wakeup.check.return_value = now + timedelta(seconds=20)
-        wakeup_error = mocker.MagicMock(spec=autosuspend.Wakeup)
-        wakeup_error.check.side_effect = autosuspend.TemporaryCheckError()
-        wakeup_earlier = mocker.MagicMock(spec=autosuspend.Wakeup)
-        wakeup_earlier.check.return_value = now + timedelta(seconds=10)
+        wakeup = _StubWakeup("wakeup", now + timedelta(seconds=20))
+        wakeup_error = _StubWakeup(
+            "wakeup_error", error=autosuspend.TemporaryCheckError()
+        )
+        wakeup_earlier = _StubWakeup("wakeup_earlier", now + timedelta(seconds=10))
         assert autosuspend.execute_wakeups(
             [wakeup, wakeup_error, wakeup_earlier], now, mocker.MagicMock()
         ) == now + timedelta(seconds=10)
 
     def test_ignore_too_early(self, mocker: MockerFixture) -> None:
         now = datetime.now(timezone.utc)
-        wakeup = mocker.MagicMock(spec=autosuspend.Wakeup)
-        wakeup.check.return_value = now
+        wakeup = _StubWakeup("wakeup", now)
         assert autosuspend.execute_wakeups([wakeup], now, mocker.MagicMock()) is None
         assert (
             autosuspend.execute_wakeups(
@@ -407,7 +448,7 @@ class TestNotifySuspend:
         dt = datetime.fromtimestamp(1525270801, timezone(timedelta(hours=4)))
         autosuspend.notify_suspend("echo {timestamp:.0f} {iso}", "not this", dt)
         mock.assert_called_once_with(
-            "echo 1525270801 2018-05-02T18:20:01+04:00", shell=True
+            ["echo", "1525270801", "2018-05-02T18:20:01+04:00"]
         )
 
     def test_date_no_command(self, mocker: MockerFixture) -> None:
@@ -419,7 +460,7 @@ class TestNotifySuspend:
     def test_no_date(self, mocker: MockerFixture) -> None:
         mock = mocker.patch("subprocess.check_call")
         autosuspend.notify_suspend("echo {timestamp:.0f} {iso}", "echo nothing", None)
-        mock.assert_called_once_with("echo nothing", shell=True)
+        mock.assert_called_once_with(["echo", "nothing"])
 
     def test_no_date_no_command(self, mocker: MockerFixture) -> None:
         mock = mocker.patch("subprocess.check_call")
@@ -443,8 +484,7 @@ class TestNotifySuspend:
 
 class TestConfigureProcessor:
     def test_minimal_config(self, mocker: MockerFixture) -> None:
-        parser = configparser.ConfigParser()
-        parser.read_string(
+        parser = config_parser(
             """
             [general]
             suspend_cmd = suspend
@@ -468,8 +508,8 @@ def test_notify_and_suspend(mocker: MockerFixture) -> None:
     )
     mock.assert_has_calls(
         [
-            mocker.call("echo notify 1525270801 2018-05-02T18:20:01+04:00", shell=True),
-            mocker.call("echo suspend", shell=True),
+            mocker.call(["echo", "notify", "1525270801", "2018-05-02T18:20:01+04:00"]),
+            mocker.call(["echo", "suspend"]),
         ]
     )
 
@@ -479,14 +519,44 @@ class _StubCheck(autosuspend.Activity):
     def create(cls, name: str, config: configparser.SectionProxy) -> "_StubCheck":
         raise NotImplementedError()
 
-    def __init__(self, name: str, match: str | None) -> None:
+    def __init__(
+        self, name: str, match: str | None, error: Exception | None = None
+    ) -> None:
         autosuspend.Activity.__init__(self, name)
         self.match = match
+        self.error = error
+        self.calls = 0
 
     def check(self) -> str | None:
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
         return self.match
 
 
+class _StubWakeup(autosuspend.Wakeup):
+    @classmethod
+    def create(cls, name: str, config: configparser.SectionProxy) -> "_StubWakeup":
+        raise NotImplementedError()
+
+    def __init__(
+        self,
+        name: str,
+        result: datetime | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        autosuspend.Wakeup.__init__(self, name)
+        self.result = result
+        self.error = error
+        self.calls = 0
+
+    def check(self, timestamp: datetime) -> datetime | None:  # noqa: ARG002
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
 class SleepFn:
     def __init__(self) -> None:
         self.called = False
@@ -553,6 +623,42 @@ class TestProcessor:
 
         assert wakeup_fn.call_arg is None
 
+    def test_first_matching_activity_ends_checks(
+        self, sleep_fn: SleepFn, wakeup_fn: WakeupFn
+    ) -> None:
+        checks = [
+            _StubCheck("first", "matches"),
+            _StubCheck("second", "matches"),
+            _StubCheck("third", None),
+        ]
+        processor = autosuspend.Processor(
+            checks, [], 2, 0, 0, sleep_fn, wakeup_fn, False
+        )
+
+        processor.iteration(datetime.now(timezone.utc), False)
+
+        assert [check.calls for check in checks] == [1, 0, 0]
+        assert not sleep_fn.called
+
+    def test_all_activities_executed(
+        self, sleep_fn: SleepFn, wakeup_fn: WakeupFn
+    ) -> None:
+        checks = [
+            _StubCheck("first", "matches"),
+            _StubCheck("second", None),
+            _StubCheck("third", "matches"),
+        ]
+        processor = autosuspend.Processor(
+            checks, [], 2, 0, 0, sleep_fn, wakeup_fn, True
+        )
+
+        start = datetime.now(timezone.utc)
+        processor.iteration(start, False)
+        processor.iteration(start + timedelta(seconds=3), False)
+
+        assert [check.calls for check in checks] == [2, 2, 2]
+        assert not sleep_fn.called
+
     def test_just_woke_up_handling(
         self, sleep_fn: SleepFn, wakeup_fn: WakeupFn
     ) -> None:
@@ -579,12 +685,9 @@ class TestProcessor:
 
         assert wakeup_fn.call_arg is None
 
-    def test_wakeup_blocks_sleep(
-        self, mocker: MockerFixture, sleep_fn: SleepFn, wakeup_fn: WakeupFn
-    ) -> None:
+    def test_wakeup_blocks_sleep(self, sleep_fn: SleepFn, wakeup_fn: WakeupFn) -> None:
         start = datetime.now(timezone.utc)
-        wakeup = mocker.MagicMock(spec=autosuspend.Wakeup)
-        wakeup.check.return_value = start + timedelta(seconds=6)
+        wakeup = _StubWakeup("wakeup", start + timedelta(seconds=6))
         processor = autosuspend.Processor(
             [_StubCheck("stub", None)], [wakeup], 2, 3.1, 0, sleep_fn, wakeup_fn, False
         )
@@ -598,13 +701,11 @@ class TestProcessor:
 
     def test_wakeup_exact_hit_does_not_block(
         self,
-        mocker: MockerFixture,
         sleep_fn: SleepFn,
         wakeup_fn: WakeupFn,
     ) -> None:
         start = datetime.now(timezone.utc)
-        wakeup = mocker.MagicMock(spec=autosuspend.Wakeup)
-        wakeup.check.return_value = start + timedelta(seconds=6)
+        wakeup = _StubWakeup("wakeup", start + timedelta(seconds=6))
         processor = autosuspend.Processor(
             [_StubCheck("stub", None)], [wakeup], 2, 3, 0, sleep_fn, wakeup_fn, False
         )
@@ -616,12 +717,9 @@ class TestProcessor:
         assert sleep_fn.called
         assert wakeup_fn.call_arg is not None
 
-    def test_wakeup_scheduled(
-        self, mocker: MockerFixture, sleep_fn: SleepFn, wakeup_fn: WakeupFn
-    ) -> None:
+    def test_wakeup_scheduled(self, sleep_fn: SleepFn, wakeup_fn: WakeupFn) -> None:
         start = datetime.now(timezone.utc)
-        wakeup = mocker.MagicMock(spec=autosuspend.Wakeup)
-        wakeup.check.return_value = start + timedelta(seconds=25)
+        wakeup = _StubWakeup("wakeup", start + timedelta(seconds=25))
         processor = autosuspend.Processor(
             [_StubCheck("stub", None)], [wakeup], 2, 10, 0, sleep_fn, wakeup_fn, False
         )
@@ -641,12 +739,9 @@ class TestProcessor:
         processor.iteration(start + timedelta(seconds=25), False)
         assert wakeup_fn.call_arg is None
 
-    def test_wakeup_delta_blocks(
-        self, mocker: MockerFixture, sleep_fn: SleepFn, wakeup_fn: WakeupFn
-    ) -> None:
+    def test_wakeup_delta_blocks(self, sleep_fn: SleepFn, wakeup_fn: WakeupFn) -> None:
         start = datetime.now(timezone.utc)
-        wakeup = mocker.MagicMock(spec=autosuspend.Wakeup)
-        wakeup.check.return_value = start + timedelta(seconds=25)
+        wakeup = _StubWakeup("wakeup", start + timedelta(seconds=25))
         processor = autosuspend.Processor(
             [_StubCheck("stub", None)], [wakeup], 2, 10, 22, sleep_fn, wakeup_fn, False
         )
@@ -657,12 +752,9 @@ class TestProcessor:
         processor.iteration(start + timedelta(seconds=3), False)
         assert not sleep_fn.called
 
-    def test_wakeup_delta_applied(
-        self, mocker: MockerFixture, sleep_fn: SleepFn, wakeup_fn: WakeupFn
-    ) -> None:
+    def test_wakeup_delta_applied(self, sleep_fn: SleepFn, wakeup_fn: WakeupFn) -> None:
         start = datetime.now(timezone.utc)
-        wakeup = mocker.MagicMock(spec=autosuspend.Wakeup)
-        wakeup.check.return_value = start + timedelta(seconds=25)
+        wakeup = _StubWakeup("wakeup", start + timedelta(seconds=25))
         processor = autosuspend.Processor(
             [_StubCheck("stub", None)], [wakeup], 2, 10, 4, sleep_fn, wakeup_fn, False
         )
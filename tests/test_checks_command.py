@@ -68,7 +68,7 @@ class TestCommandActivity(CheckTest):
         mock.assert_called_once_with("foo bar", shell=True)
 
     def test_reports_missing_commands(self) -> None:
-        with pytest.raises(SevereCheckError):
+        with pytest.raises(SevereCheckError, match="'thisreallydoesnotexist'"):
             CommandActivity.create(
                 "name", config_section({"command": "thisreallydoesnotexist"})
             ).check()  # type: ignore
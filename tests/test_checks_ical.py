@@ -1,10 +1,13 @@
 from collections.abc import Callable
 from datetime import timedelta
+from io import BytesIO
 from pathlib import Path
 
 from dateutil import parser
 from dateutil.tz import tzlocal
 from freezegun import freeze_time
+import icalendar
+from pytest_mock import MockerFixture
 
 from autosuspend.checks import Check
 from autosuspend.checks.ical import (
@@ -243,6 +246,24 @@ class TestListCalendarEvents:
 
             assert expected_start_times == [e.start for e in events]
 
+    def test_recurring_ended_before_range(self, datadir: Path) -> None:
+        with (datadir / "exclusions.ics").open("rb") as f:
+            start = parser.parse("2018-06-18 04:00:00 UTC")
+            end = start + timedelta(weeks=2)
+            events = list_calendar_events(f, start, end)
+
+            assert events == []
+
+    def test_recurring_ended_with_running_instance(self, datadir: Path) -> None:
+        with (datadir / "exclusions.ics").open("rb") as f:
+            start = parser.parse("2018-06-17 13:00:00 UTC")
+            end = start + timedelta(weeks=2)
+            events = list_calendar_events(f, start, end)
+
+            assert [e.start for e in events] == [
+                parser.parse("2018-06-17 12:00:00 UTC")
+            ]
+
     def test_reucrring_single_changes(self, datadir: Path) -> None:
         with (datadir / "single-change.ics").open("rb") as f:
             start = parser.parse("2018-06-11 00:00:00 UTC")
@@ -400,6 +421,24 @@ class TestListCalendarEvents:
 
             assert expected_start_times == [e.start for e in events]
 
+    def test_unchanged_data_is_parsed_once(
+        self, datadir: Path, mocker: MockerFixture
+    ) -> None:
+        data = (datadir / "simple-recurring.ics").read_bytes()
+        # mark the data as unique so that no other test has populated the cache
+        data = data.replace(
+            b"END:VCALENDAR", b"X-TEST-UNIQUE:parse-once\r\nEND:VCALENDAR"
+        )
+        from_ical = mocker.spy(icalendar.Calendar, "from_ical")
+        start = parser.parse("2018-06-18 04:00:00 UTC")
+        end = start + timedelta(weeks=2)
+
+        first = list_calendar_events(BytesIO(data), start, end)
+        second = list_calendar_events(BytesIO(data), start, end)
+
+        assert first == second
+        assert from_ical.call_count == 1
+
 
 class TestActiveCalendarEvent(CheckTest):
     def create_instance(self, name: str) -> Check:
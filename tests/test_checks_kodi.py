@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 import json
 
 import pytest
@@ -144,17 +145,19 @@ class TestKodiIdleTime(CheckTest):
 
         assert check._url.split("?")[0] == "http://localhost:8080/jsonrpc"
 
-    def test_create_timeout_no_number(self) -> None:
-        with pytest.raises(ConfigurationError):
-            KodiIdleTime.create(
-                "name", config_section({"url": "anurl", "timeout": "string"})
-            )
-
-    def test_create_idle_time_no_number(self) -> None:
+    @pytest.mark.parametrize(
+        "config",
+        [
+            {"url": "anurl", "timeout": "string"},
+            {"url": "anurl", "idle_time": "string"},
+        ],
+        ids=["timeout_no_number", "idle_time_no_number"],
+    )
+    def test_create_raises_with_invalid_numbers(
+        self, config: Mapping[str, str]
+    ) -> None:
         with pytest.raises(ConfigurationError):
-            KodiIdleTime.create(
-                "name", config_section({"url": "anurl", "idle_time": "string"})
-            )
+            KodiIdleTime.create("name", config_section(config))
 
     def test_no_result(self, mocker: MockerFixture) -> None:
         mock_reply = mocker.MagicMock()
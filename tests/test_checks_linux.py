@@ -1,11 +1,13 @@
 from collections import namedtuple
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from datetime import datetime, timezone
+import os
 from pathlib import Path
 import re
 import socket
 import sys
 from typing import Any
+from unittest.mock import Mock
 
 from freezegun import freeze_time
 import psutil
@@ -34,46 +36,38 @@ from . import CheckTest
 from tests.utils import config_section
 
 
+_MATCH_ALL = re.compile(".*")
+
+
+def _patch_psutil(mocker: MockerFixture, **return_values: Any) -> None:
+    """Patch several psutil functions to return the given values."""
+    for function, value in return_values.items():
+        mocker.patch(f"psutil.{function}").return_value = value
+
+
 class TestUsers(CheckTest):
     def create_instance(self, name: str) -> Check:
-        return Users(name, re.compile(".*"), re.compile(".*"), re.compile(".*"))
+        return Users(name, _MATCH_ALL, _MATCH_ALL, _MATCH_ALL)
 
-    @staticmethod
-    def create_suser(
-        name: str, terminal: str, host: str, started: float, pid: int
-    ) -> psutil._common.suser:
-        return psutil._common.suser(name, terminal, host, started, pid)
+    SAMPLE_USER = psutil._common.suser("foo", "pts1", "host", 12345, 12345)
 
     def test_reports_no_activity_without_users(self, mocker: MockerFixture) -> None:
         mocker.patch("psutil.users").return_value = []
 
-        assert (
-            Users("users", re.compile(".*"), re.compile(".*"), re.compile(".*")).check()
-            is None
-        )
+        assert Users("users", _MATCH_ALL, _MATCH_ALL, _MATCH_ALL).check() is None
 
     def test_matching_users(self, mocker: MockerFixture) -> None:
-        mocker.patch("psutil.users").return_value = [
-            self.create_suser("foo", "pts1", "host", 12345, 12345)
-        ]
+        mocker.patch("psutil.users").return_value = [self.SAMPLE_USER]
 
-        assert (
-            Users("users", re.compile(".*"), re.compile(".*"), re.compile(".*")).check()
-            is not None
-        )
+        assert Users("users", _MATCH_ALL, _MATCH_ALL, _MATCH_ALL).check() is not None
 
     def test_detect_no_activity_if_no_matching_user_exists(
         self, mocker: MockerFixture
     ) -> None:
-        mocker.patch("psutil.users").return_value = [
-            self.create_suser("foo", "pts1", "host", 12345, 12345)
-        ]
+        mocker.patch("psutil.users").return_value = [self.SAMPLE_USER]
 
         assert (
-            Users(
-                "users", re.compile("narf"), re.compile(".*"), re.compile(".*")
-            ).check()
-            is None
+            Users("users", re.compile("narf"), _MATCH_ALL, _MATCH_ALL).check() is None
         )
 
     class TestCreate:
@@ -112,6 +106,8 @@ class TestProcesses(CheckTest):
         return Processes(name, ["foo"])
 
     class StubProcess:
+        __slots__ = ("_name",)
+
         def __init__(self, name: str) -> None:
             self._name = name
 
@@ -119,31 +115,33 @@ class TestProcesses(CheckTest):
             return self._name
 
     class RaisingProcess:
+        __slots__ = ()
+
         def name(self) -> str:
             raise psutil.NoSuchProcess(42)
 
     def test_detects_activity_with_matching_process(
         self, mocker: MockerFixture
     ) -> None:
-        mocker.patch("psutil.process_iter").return_value = [
-            self.StubProcess("blubb"),
-            self.StubProcess("nonmatching"),
-        ]
+        mocker.patch("psutil.process_iter").return_value = (
+            self.StubProcess(name) for name in ("blubb", "nonmatching")
+        )
 
         assert Processes("foo", ["dummy", "blubb", "other"]).check() is not None
 
     def test_ignores_no_such_process_errors(self, mocker: MockerFixture) -> None:
-        mocker.patch("psutil.process_iter").return_value = [self.RaisingProcess()]
+        mocker.patch("psutil.process_iter").return_value = iter(
+            (self.RaisingProcess(),)
+        )
 
         Processes("foo", ["dummy"]).check()
 
     def test_detect_no_activity_for_non_matching_processes(
         self, mocker: MockerFixture
     ) -> None:
-        mocker.patch("psutil.process_iter").return_value = [
-            self.StubProcess("asdfasdf"),
-            self.StubProcess("nonmatching"),
-        ]
+        mocker.patch("psutil.process_iter").return_value = (
+            self.StubProcess(name) for name in ("asdfasdf", "nonmatching")
+        )
 
         assert Processes("foo", ["dummy", "blubb", "other"]).check() is None
 
@@ -151,11 +149,7 @@ class TestProcesses(CheckTest):
         def test_it_works_with_a_valid_config(self) -> None:
             assert Processes.create(
                 "name", config_section({"processes": "foo, bar, narf"})
-            )._processes == [
-                "foo",
-                "bar",
-                "narf",
-            ]
+            )._processes == frozenset({"foo", "bar", "narf"})
 
         def test_raises_if_no_processes_are_configured(self) -> None:
             with pytest.raises(ConfigurationError):
@@ -176,6 +170,41 @@ class TestActiveConnection(CheckTest):
     def create_instance(self, name: str) -> Check:
         return ActiveConnection(name, [10])
 
+    @staticmethod
+    @pytest.fixture(scope="class")
+    def own_addresses() -> dict[str, list[snic]]:
+        return {
+            "dummy": [
+                snic(
+                    socket.AF_INET,
+                    TestActiveConnection.MY_ADDRESS,
+                    "255.255.255.0",
+                    None,
+                    None,
+                ),
+                snic(
+                    socket.AF_INET6,
+                    TestActiveConnection.MY_ADDRESS_IPV6,
+                    "ffff:ffff:ffff:ffff::",
+                    None,
+                    None,
+                ),
+                snic(
+                    socket.AF_INET6,
+                    TestActiveConnection.MY_ADDRESS_IPV6_SCOPED,
+                    "ffff:ffff:ffff:ffff::",
+                    None,
+                    None,
+                ),
+            ]
+        }
+
+    @staticmethod
+    @pytest.fixture(scope="class")
+    def port_check() -> ActiveConnection:
+        """Stateless check instance shared by all connection tests."""
+        return ActiveConnection("foo", [10, TestActiveConnection.MY_PORT, 30])
+
     @pytest.mark.parametrize(
         "connection",
         [
@@ -223,93 +252,72 @@ class TestActiveConnection(CheckTest):
         ],
     )
     def test_detect_activity_if_port_is_connected(
-        self, mocker: MockerFixture, connection: psutil._common.sconn
+        self,
+        mocker: MockerFixture,
+        connection: psutil._common.sconn,
+        own_addresses: dict[str, list[snic]],
+        port_check: ActiveConnection,
     ) -> None:
-        mocker.patch("psutil.net_if_addrs").return_value = {
-            "dummy": [
-                snic(socket.AF_INET, self.MY_ADDRESS, "255.255.255.0", None, None),
-                snic(
-                    socket.AF_INET6,
-                    self.MY_ADDRESS_IPV6,
-                    "ffff:ffff:ffff:ffff::",
-                    None,
-                    None,
-                ),
-                snic(
-                    socket.AF_INET6,
-                    self.MY_ADDRESS_IPV6_SCOPED,
-                    "ffff:ffff:ffff:ffff::",
-                    None,
-                    None,
-                ),
-            ],
-        }
-        mocker.patch("psutil.net_connections").return_value = [connection]
+        _patch_psutil(mocker, net_if_addrs=own_addresses, net_connections=[connection])
 
-        assert ActiveConnection("foo", [10, self.MY_PORT, 30]).check() is not None
+        assert port_check.check() is not None
 
     @pytest.mark.parametrize(
-        "connection",
+        ("local_address", "remote_address", "status"),
         [
-            # not my port
-            psutil._common.sconn(
-                -1,
-                socket.AF_INET,
-                socket.SOCK_STREAM,
-                (MY_ADDRESS, 32),
-                ("42.42.42.42", 42),
-                "ESTABLISHED",
-                None,
-            ),
-            # not my local address
-            psutil._common.sconn(
-                -1,
-                socket.AF_INET,
-                socket.SOCK_STREAM,
-                ("33.33.33.33", MY_PORT),
-                ("42.42.42.42", 42),
-                "ESTABLISHED",
-                None,
-            ),
-            # not established
-            psutil._common.sconn(
-                -1,
-                socket.AF_INET,
-                socket.SOCK_STREAM,
-                (MY_ADDRESS, MY_PORT),
-                ("42.42.42.42", 42),
-                "NARF",
-                None,
-            ),
-            # I am the client
-            psutil._common.sconn(
-                -1,
-                socket.AF_INET,
-                socket.SOCK_STREAM,
-                ("42.42.42.42", 42),
-                (MY_ADDRESS, MY_PORT),
-                "NARF",
-                None,
-            ),
+            ((MY_ADDRESS, 32), ("42.42.42.42", 42), "ESTABLISHED"),
+            (("33.33.33.33", MY_PORT), ("42.42.42.42", 42), "ESTABLISHED"),
+            ((MY_ADDRESS, MY_PORT), ("42.42.42.42", 42), "NARF"),
+            (("42.42.42.42", 42), (MY_ADDRESS, MY_PORT), "NARF"),
+        ],
+        ids=[
+            "not_my_port",
+            "not_my_local_address",
+            "not_established",
+            "i_am_the_client",
         ],
     )
     def test_detects_no_activity_if_port_is_not_connected(
-        self, mocker: MockerFixture, connection: psutil._common.sconn
+        self,
+        mocker: MockerFixture,
+        local_address: tuple[str, int],
+        remote_address: tuple[str, int],
+        status: str,
+        own_addresses: dict[str, list[snic]],
+        port_check: ActiveConnection,
     ) -> None:
-        mocker.patch("psutil.net_if_addrs").return_value = {
-            "dummy": [
-                snic(socket.AF_INET, self.MY_ADDRESS, "255.255.255.0", None, None)
-            ]
-        }
-        mocker.patch("psutil.net_connections").return_value = [connection]
+        connection = psutil._common.sconn(
+            -1,
+            socket.AF_INET,
+            socket.SOCK_STREAM,
+            local_address,
+            remote_address,
+            status,
+            None,
+        )
+        _patch_psutil(mocker, net_if_addrs=own_addresses, net_connections=[connection])
+
+        assert port_check.check() is None
+
+    def test_only_lists_tcp_connections(
+        self,
+        mocker: MockerFixture,
+        own_addresses: dict[str, list[snic]],
+        port_check: ActiveConnection,
+    ) -> None:
+        mocker.patch("psutil.net_if_addrs").return_value = own_addresses
+        net_connections = mocker.patch("psutil.net_connections")
+        net_connections.return_value = []
+
+        port_check.check()
 
-        assert ActiveConnection("foo", [10, self.MY_PORT, 30]).check() is None
+        net_connections.assert_called_once_with(kind="tcp")
 
     class TestCreate:
         def test_it_works_with_a_valid_config(self) -> None:
             assert ActiveConnection.create(
                 "name", config_section({"ports": "10,20,30"})
-            )._ports == {10, 20, 30}
+            )._ports == frozenset({10, 20, 30})
 
         def test_raises_if_no_ports_are_configured(self) -> None:
             with pytest.raises(ConfigurationError):
@@ -358,10 +366,28 @@ class TestNetworkBandwidth(CheckTest):
         httpserver.expect_request("").respond_with_json({"foo": "bar"})
         return httpserver.url_for("")
 
-    def test_detects_non_mocked_activity(self, serve_data_url: str) -> None:
-        check = NetworkBandwidth("name", psutil.net_if_addrs().keys(), 0, 0)
+    @staticmethod
+    @pytest.fixture(scope="class")
+    def host_interfaces() -> list[str]:
+        return list(psutil.net_if_addrs().keys())
+
+    @staticmethod
+    @pytest.fixture(scope="class")
+    def http_session() -> Iterable[requests.Session]:
+        """Session shared by all tests to reuse connections to the test server."""
+        with requests.Session() as session:
+            yield session
+
+    @pytest.mark.network
+    def test_detects_non_mocked_activity(
+        self,
+        serve_data_url: str,
+        host_interfaces: list[str],
+        http_session: requests.Session,
+    ) -> None:
+        check = NetworkBandwidth("name", host_interfaces, 0, 0)
         # make some traffic
-        requests.get(serve_data_url, timeout=5)
+        http_session.get(serve_data_url, timeout=5)
         assert check.check() is not None
 
     @pytest.fixture
@@ -444,6 +470,7 @@ class TestNetworkBandwidth(CheckTest):
             with pytest.raises(ConfigurationError, match=error_match):
                 NetworkBandwidth.create("name", config_section(config))
 
+    @pytest.mark.network
     @pytest.mark.parametrize(
         ("send_threshold", "receive_threshold", "match"),
         [(sys.float_info.max, 0, "receive"), (0, sys.float_info.max, "sending")],
@@ -454,31 +481,45 @@ class TestNetworkBandwidth(CheckTest):
         receive_threshold: float,
         match: str,
         serve_data_url: str,
+        host_interfaces: list[str],
+        http_session: requests.Session,
     ) -> None:
         check = NetworkBandwidth(
-            "name", psutil.net_if_addrs().keys(), send_threshold, receive_threshold
+            "name", host_interfaces, send_threshold, receive_threshold
         )
         # make some traffic
-        requests.get(serve_data_url, timeout=5)
+        http_session.get(serve_data_url, timeout=5)
         res = check.check()
         assert res is not None
         assert match in res
 
-    def test_reports_no_activity_below_threshold(self, serve_data_url: str) -> None:
+    @pytest.mark.network
+    def test_reports_no_activity_below_threshold(
+        self,
+        serve_data_url: str,
+        host_interfaces: list[str],
+        http_session: requests.Session,
+    ) -> None:
         check = NetworkBandwidth(
-            "name", psutil.net_if_addrs().keys(), sys.float_info.max, sys.float_info.max
+            "name", host_interfaces, sys.float_info.max, sys.float_info.max
         )
         # make some traffic
-        requests.get(serve_data_url, timeout=5)
+        http_session.get(serve_data_url, timeout=5)
         assert check.check() is None
 
-    def test_internal_state_updating_works(self, serve_data_url: str) -> None:
+    @pytest.mark.network
+    def test_internal_state_updating_works(
+        self,
+        serve_data_url: str,
+        host_interfaces: list[str],
+        http_session: requests.Session,
+    ) -> None:
         check = NetworkBandwidth(
-            "name", psutil.net_if_addrs().keys(), sys.float_info.max, sys.float_info.max
+            "name", host_interfaces, sys.float_info.max, sys.float_info.max
         )
         check.check()
         old_state = check._previous_values
-        requests.get(serve_data_url, timeout=5)
+        http_session.get(serve_data_url, timeout=5)
         check.check()
         assert old_state != check._previous_values
 
@@ -533,28 +574,28 @@ class TestPing(CheckTest):
     def create_instance(self, name: str) -> Check:
         return Ping(name, "8.8.8.8")
 
-    def test_calls_ping_correctly(self, mocker: MockerFixture) -> None:
-        mock = mocker.patch("subprocess.call")
-        mock.return_value = 1
+    @staticmethod
+    @pytest.fixture
+    def subprocess_call(mocker: MockerFixture) -> Mock:
+        return mocker.patch("subprocess.call")
+
+    def test_calls_ping_correctly(self, subprocess_call: Mock) -> None:
+        subprocess_call.return_value = 1
 
         hosts = ["abc", "129.123.145.42"]
 
         assert Ping("name", hosts).check() is None
 
-        assert mock.call_count == len(hosts)
-        for (args, _), host in zip(mock.call_args_list, hosts):
-            assert args[0][-1] == host
+        assert [call.args[0][-1] for call in subprocess_call.call_args_list] == hosts
 
-    def test_raises_if_the_ping_binary_is_missing(self, mocker: MockerFixture) -> None:
-        mock = mocker.patch("subprocess.call")
-        mock.side_effect = FileNotFoundError()
+    def test_raises_if_the_ping_binary_is_missing(self, subprocess_call: Mock) -> None:
+        subprocess_call.side_effect = FileNotFoundError()
 
         with pytest.raises(SevereCheckError):
             Ping("name", ["test"]).check()
 
-    def test_detect_activity_if_ping_succeeds(self, mocker: MockerFixture) -> None:
-        mock = mocker.patch("subprocess.call")
-        mock.return_value = 0
+    def test_detect_activity_if_ping_succeeds(self, subprocess_call: Mock) -> None:
+        subprocess_call.return_value = 0
         assert Ping("name", ["foo"]).check() is not None
 
     class TestCreate:
@@ -587,6 +628,47 @@ class TestFile(CheckTest):
             datetime.now(timezone.utc)
         ) == datetime.fromtimestamp(42, timezone.utc)
 
+    def test_unchanged_file_is_read_once(
+        self, tmp_path: Path, mocker: MockerFixture
+    ) -> None:
+        test_file = tmp_path / "file"
+        test_file.write_text("42\n\n")
+        check = File("name", test_file)
+        read_text = mocker.spy(Path, "read_text")
+
+        expected = datetime.fromtimestamp(42, timezone.utc)
+        assert check.check(datetime.now(timezone.utc)) == expected
+        assert check.check(datetime.now(timezone.utc)) == expected
+        assert read_text.call_count == 1
+
+    def test_changed_file_is_read_again(self, tmp_path: Path) -> None:
+        test_file = tmp_path / "file"
+        test_file.write_text("42\n\n")
+        check = File("name", test_file)
+        check.check(datetime.now(timezone.utc))
+
+        test_file.write_text("43\n\n")
+        stat = test_file.stat()
+        os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert check.check(datetime.now(timezone.utc)) == datetime.fromtimestamp(
+            43, timezone.utc
+        )
+
+    def test_resized_file_with_same_mtime_is_read_again(self, tmp_path: Path) -> None:
+        test_file = tmp_path / "file"
+        test_file.write_text("42\n\n")
+        stat = test_file.stat()
+        check = File("name", test_file)
+        check.check(datetime.now(timezone.utc))
+
+        test_file.write_text("1234\n\n")
+        os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert check.check(datetime.now(timezone.utc)) == datetime.fromtimestamp(
+            1234, timezone.utc
+        )
+
     def test_reports_no_wakeup_if_file_does_not_exist(self, tmp_path: Path) -> None:
         assert File("name", tmp_path / "narf").check(datetime.now(timezone.utc)) is None
 
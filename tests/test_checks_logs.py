@@ -13,19 +13,22 @@ from . import CheckTest
 from .utils import config_section
 
 
+_MATCH_LINE = re.compile(r"^(.*)$")
+
+
 class TestLastLogActivity(CheckTest):
     def create_instance(self, name: str) -> LastLogActivity:
         return LastLogActivity(
             name=name,
             log_file=Path("some_file"),
-            pattern=re.compile("^(.*)$"),
+            pattern=_MATCH_LINE,
             delta=timedelta(minutes=10),
             encoding="ascii",
             default_timezone=timezone.utc,
         )
 
-    def test_is_active(self, tmpdir: Path) -> None:
-        file_path = tmpdir / "test.log"
+    def test_is_active(self, tmp_path: Path) -> None:
+        file_path = tmp_path / "test.log"
         file_path.write_text("2020-02-02 12:12:23", encoding="ascii")
 
         with freeze_time("2020-02-02 12:15:00"):
@@ -33,7 +36,7 @@ class TestLastLogActivity(CheckTest):
                 LastLogActivity(
                     "test",
                     file_path,
-                    re.compile(r"^(.*)$"),
+                    _MATCH_LINE,
                     timedelta(minutes=10),
                     "ascii",
                     timezone.utc,
@@ -41,8 +44,8 @@ class TestLastLogActivity(CheckTest):
                 is not None
             )
 
-    def test_is_not_active(self, tmpdir: Path) -> None:
-        file_path = tmpdir / "test.log"
+    def test_is_not_active(self, tmp_path: Path) -> None:
+        file_path = tmp_path / "test.log"
         file_path.write_text("2020-02-02 12:12:23", encoding="ascii")
 
         with freeze_time("2020-02-02 12:35:00"):
@@ -50,7 +53,7 @@ class TestLastLogActivity(CheckTest):
                 LastLogActivity(
                     "test",
                     file_path,
-                    re.compile(r"^(.*)$"),
+                    _MATCH_LINE,
                     timedelta(minutes=10),
                     "ascii",
                     timezone.utc,
@@ -58,8 +61,8 @@ class TestLastLogActivity(CheckTest):
                 is None
             )
 
-    def test_uses_last_line(self, tmpdir: Path) -> None:
-        file_path = tmpdir / "test.log"
+    def test_uses_last_line(self, tmp_path: Path) -> None:
+        file_path = tmp_path / "test.log"
         # last line is too old and must be used
         file_path.write_text(
             "\n".join(["2020-02-02 12:12:23", "1900-01-01"]), encoding="ascii"
@@ -70,7 +73,7 @@ class TestLastLogActivity(CheckTest):
                 LastLogActivity(
                     "test",
                     file_path,
-                    re.compile(r"^(.*)$"),
+                    _MATCH_LINE,
                     timedelta(minutes=10),
                     "ascii",
                     timezone.utc,
@@ -78,8 +81,8 @@ class TestLastLogActivity(CheckTest):
                 is None
             )
 
-    def test_ignores_lines_that_do_not_match(self, tmpdir: Path) -> None:
-        file_path = tmpdir / "test.log"
+    def test_ignores_lines_that_do_not_match(self, tmp_path: Path) -> None:
+        file_path = tmp_path / "test.log"
         file_path.write_text("ignored", encoding="ascii")
 
         assert (
@@ -94,8 +97,8 @@ class TestLastLogActivity(CheckTest):
             is None
         )
 
-    def test_uses_pattern(self, tmpdir: Path) -> None:
-        file_path = tmpdir / "test.log"
+    def test_uses_pattern(self, tmp_path: Path) -> None:
+        file_path = tmp_path / "test.log"
         file_path.write_text("foo2020-02-02 12:12:23bar", encoding="ascii")
 
         with freeze_time("2020-02-02 12:15:00"):
@@ -111,8 +114,8 @@ class TestLastLogActivity(CheckTest):
                 is not None
             )
 
-    def test_uses_given_timezone(self, tmpdir: Path) -> None:
-        file_path = tmpdir / "test.log"
+    def test_uses_given_timezone(self, tmp_path: Path) -> None:
+        file_path = tmp_path / "test.log"
         # would match if timezone wasn't used
         file_path.write_text("2020-02-02 12:12:00", encoding="ascii")
 
@@ -121,7 +124,7 @@ class TestLastLogActivity(CheckTest):
                 LastLogActivity(
                     "test",
                     file_path,
-                    re.compile(r"^(.*)$"),
+                    _MATCH_LINE,
                     timedelta(minutes=10),
                     "ascii",
                     timezone(offset=timedelta(hours=10)),
@@ -129,8 +132,8 @@ class TestLastLogActivity(CheckTest):
                 is None
             )
 
-    def test_prefers_parsed_timezone(self, tmpdir: Path) -> None:
-        file_path = tmpdir / "test.log"
+    def test_prefers_parsed_timezone(self, tmp_path: Path) -> None:
+        file_path = tmp_path / "test.log"
         # would not match if provided timezone wasn't used
         file_path.write_text("2020-02-02T12:12:01-01:00", encoding="ascii")
 
@@ -139,7 +142,7 @@ class TestLastLogActivity(CheckTest):
                 LastLogActivity(
                     "test",
                     file_path,
-                    re.compile(r"^(.*)$"),
+                    _MATCH_LINE,
                     timedelta(minutes=10),
                     "ascii",
                     timezone.utc,
@@ -147,8 +150,8 @@ class TestLastLogActivity(CheckTest):
                 is not None
             )
 
-    def test_fails_if_dates_cannot_be_parsed(self, tmpdir: Path) -> None:
-        file_path = tmpdir / "test.log"
+    def test_fails_if_dates_cannot_be_parsed(self, tmp_path: Path) -> None:
+        file_path = tmp_path / "test.log"
         # would match if timezone wasn't used
         file_path.write_text("202000xxx", encoding="ascii")
 
@@ -156,14 +159,14 @@ class TestLastLogActivity(CheckTest):
             LastLogActivity(
                 "test",
                 file_path,
-                re.compile(r"^(.*)$"),
+                _MATCH_LINE,
                 timedelta(minutes=10),
                 "ascii",
                 timezone.utc,
             ).check()
 
-    def test_fails_if_dates_are_in_the_future(self, tmpdir: Path) -> None:
-        file_path = tmpdir / "test.log"
+    def test_fails_if_dates_are_in_the_future(self, tmp_path: Path) -> None:
+        file_path = tmp_path / "test.log"
         # would match if timezone wasn't used
         file_path.write_text("2022-01-01", encoding="ascii")
 
@@ -171,20 +174,20 @@ class TestLastLogActivity(CheckTest):
             LastLogActivity(
                 "test",
                 file_path,
-                re.compile(r"^(.*)$"),
+                _MATCH_LINE,
                 timedelta(minutes=10),
                 "ascii",
                 timezone.utc,
             ).check()
 
-    def test_fails_if_file_cannot_be_read(self, tmpdir: Path) -> None:
-        file_path = tmpdir / "test.log"
+    def test_fails_if_file_cannot_be_read(self, tmp_path: Path) -> None:
+        file_path = tmp_path / "test.log"
 
         with pytest.raises(TemporaryCheckError):
             LastLogActivity(
                 "test",
                 file_path,
-                re.compile(r"^(.*)$"),
+                _MATCH_LINE,
                 timedelta(minutes=10),
                 "ascii",
                 timezone.utc,
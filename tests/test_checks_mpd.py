@@ -1,8 +1,8 @@
+from collections.abc import Mapping
 from typing import Any
 
 import mpd
 import pytest
-from pytest_mock import MockerFixture
 
 from autosuspend.checks import Check, ConfigurationError, TemporaryCheckError
 from autosuspend.checks.mpd import Mpd
@@ -36,13 +36,29 @@ class TestMpd(CheckTest):
 
         assert check.check() is None
 
-    def test_correct_mpd_interaction(self, mocker: MockerFixture) -> None:
-        mock_instance = mocker.MagicMock(spec=mpd.MPDClient)
-        mock_instance.status.return_value = {"state": "play"}
-        timeout_property = mocker.PropertyMock()
-        type(mock_instance).timeout = timeout_property
-        mock = mocker.patch("autosuspend.checks.mpd.MPDClient")
-        mock.return_value = mock_instance
+    def test_correct_mpd_interaction(self, monkeypatch: Any) -> None:
+        clients = []
+
+        class FakeClient:
+            def __init__(self) -> None:
+                self.timeout: float | None = None
+                self.calls: list[tuple] = []
+                clients.append(self)
+
+            def connect(self, host: str, port: int) -> None:
+                self.calls.append(("connect", host, port))
+
+            def status(self) -> dict:
+                self.calls.append(("status",))
+                return {"state": "play"}
+
+            def close(self) -> None:
+                self.calls.append(("close",))
+
+            def disconnect(self) -> None:
+                self.calls.append(("disconnect",))
+
+        monkeypatch.setattr("autosuspend.checks.mpd.MPDClient", FakeClient)
 
         host = "foo"
         port = 42
@@ -50,11 +66,14 @@ class TestMpd(CheckTest):
 
         assert Mpd("name", host, port, timeout).check() is not None
 
-        timeout_property.assert_called_once_with(timeout)
-        mock_instance.connect.assert_called_once_with(host, port)
-        mock_instance.status.assert_called_once_with()
-        mock_instance.close.assert_called_once_with()
-        mock_instance.disconnect.assert_called_once_with()
+        assert len(clients) == 1
+        assert clients[0].timeout == timeout
+        assert clients[0].calls == [
+            ("connect", host, port),
+            ("status",),
+            ("close",),
+            ("disconnect",),
+        ]
 
     @pytest.mark.parametrize("exception_type", [ConnectionError, mpd.ConnectionError])
     def test_handle_connection_errors(self, exception_type: type) -> None:
@@ -85,28 +104,16 @@ class TestMpd(CheckTest):
         assert check._port == 1234
         assert check._timeout == 12
 
-    def test_create_port_no_number(self) -> None:
-        with pytest.raises(ConfigurationError):
-            Mpd.create(
-                "name",
-                config_section(
-                    {
-                        "host": "host",
-                        "port": "string",
-                        "timeout": "12",
-                    }
-                ),
-            )
-
-    def test_create_timeout_no_number(self) -> None:
+    @pytest.mark.parametrize(
+        "config",
+        [
+            {"host": "host", "port": "string", "timeout": "12"},
+            {"host": "host", "port": "10", "timeout": "string"},
+        ],
+        ids=["port_no_number", "timeout_no_number"],
+    )
+    def test_create_raises_with_invalid_numbers(
+        self, config: Mapping[str, str]
+    ) -> None:
         with pytest.raises(ConfigurationError):
-            Mpd.create(
-                "name",
-                config_section(
-                    {
-                        "host": "host",
-                        "port": "10",
-                        "timeout": "string",
-                    }
-                ),
-            )
+            Mpd.create("name", config_section(config))
@@ -10,25 +10,38 @@ from autosuspend.checks.smb import Smb
 from . import CheckTest
 
 
+@pytest.fixture(scope="module")
+def smbstatus_outputs() -> dict[str, bytes]:
+    """Recorded smbstatus outputs by file name, read once for all tests."""
+    data_dir = Path(__file__).with_suffix("")
+    return {path.name: path.read_bytes() for path in data_dir.iterdir()}
+
+
 class TestSmb(CheckTest):
     def create_instance(self, name: str) -> Check:
         return Smb(name)
 
-    def test_no_connections(self, datadir: Path, mocker: MockerFixture) -> None:
-        mocker.patch("subprocess.check_output").return_value = (
-            datadir / "smbstatus_no_connections"
-        ).read_bytes()
+    def test_no_connections(self, smbstatus_outputs: dict[str, bytes]) -> None:
+        output = smbstatus_outputs["smbstatus_no_connections"].decode("utf-8")
+
+        assert Smb._parse_connections(output) == []
 
-        assert Smb("foo").check() is None
+    def test_with_connections(self, smbstatus_outputs: dict[str, bytes]) -> None:
+        output = smbstatus_outputs["smbstatus_with_connections"].decode("utf-8")
 
-    def test_with_connections(self, datadir: Path, mocker: MockerFixture) -> None:
-        mocker.patch("subprocess.check_output").return_value = (
-            datadir / "smbstatus_with_connections"
-        ).read_bytes()
+        assert len(Smb._parse_connections(output)) == 2
+
+    def test_reports_connections(
+        self, smbstatus_outputs: dict[str, bytes], mocker: MockerFixture
+    ) -> None:
+        mocker.patch("subprocess.check_output").return_value = smbstatus_outputs[
+            "smbstatus_with_connections"
+        ]
 
         res = Smb("foo").check()
         assert res is not None
-        assert len(res.splitlines()) == 3
+        # header line plus two connections, joined without a trailing newline
+        assert res.count("\n") == 2
 
     def test_call_error(self, mocker: MockerFixture) -> None:
         mocker.patch(
@@ -45,5 +58,23 @@ class TestSmb(CheckTest):
         with pytest.raises(SevereCheckError):
             Smb("foo").check()
 
+    def test_uses_resolved_executable(self, mocker: MockerFixture) -> None:
+        mocker.patch("shutil.which").return_value = "/opt/samba/bin/smbstatus"
+        check_output = mocker.patch("subprocess.check_output")
+        check_output.return_value = b""
+
+        Smb("foo").check()
+
+        check_output.assert_called_once_with(["/opt/samba/bin/smbstatus", "-b"])
+
+    def test_falls_back_to_path_lookup(self, mocker: MockerFixture) -> None:
+        mocker.patch("shutil.which").return_value = None
+        check_output = mocker.patch("subprocess.check_output")
+        check_output.return_value = b""
+
+        Smb("foo").check()
+
+        check_output.assert_called_once_with(["smbstatus", "-b"])
+
     def test_create(self) -> None:
         assert isinstance(Smb.create("name", None), Smb)
@@ -2,6 +2,7 @@ from datetime import datetime, timedelta, timezone
 import re
 from unittest.mock import Mock
 
+import dbus
 from dbus.proxies import ProxyObject
 import pytest
 from pytest_mock import MockerFixture
@@ -17,6 +18,9 @@ from . import CheckTest
 from .utils import config_section
 
 
+_MATCH_ALL = re.compile(".*")
+
+
 @pytest.mark.skip(reason="No dbusmock implementation available")
 def test_next_timer_executions() -> None:
     assert next_timer_executions() is not None
@@ -29,7 +33,7 @@ class TestSystemdTimer(CheckTest):
         return mocker.patch("autosuspend.checks.systemd.next_timer_executions")
 
     def create_instance(self, name: str) -> Check:
-        return SystemdTimer(name, re.compile(".*"))
+        return SystemdTimer(name, _MATCH_ALL)
 
     def test_create_handles_incorrect_expressions(self) -> None:
         with pytest.raises(ConfigurationError):
@@ -43,7 +47,7 @@ class TestSystemdTimer(CheckTest):
         next_timer_executions.return_value = {}
         now = datetime.now(timezone.utc)
 
-        assert SystemdTimer("foo", re.compile(".*")).check(now) is None
+        assert SystemdTimer("foo", _MATCH_ALL).check(now) is None
 
     def test_ignores_non_matching_timers(self, next_timer_executions: Mock) -> None:
         now = datetime.now(timezone.utc)
@@ -67,7 +71,13 @@ class TestSystemdTimer(CheckTest):
             "matching": now,
         }
 
-        assert SystemdTimer("foo", re.compile(".*")).check(now) is now
+        assert SystemdTimer("foo", _MATCH_ALL).check(now) is now
+
+    def test_dbus_errors_are_temporary(self, next_timer_executions: Mock) -> None:
+        next_timer_executions.side_effect = dbus.exceptions.DBusException("test")
+
+        with pytest.raises(TemporaryCheckError):
+            SystemdTimer("foo", _MATCH_ALL).check(datetime.now(timezone.utc))
 
 
 class TestLogindSessionsIdle(CheckTest):
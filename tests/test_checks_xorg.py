@@ -1,6 +1,9 @@
+from collections.abc import Mapping
 from getpass import getuser
 import logging
+import os
 from pathlib import Path
+import pwd
 import re
 import subprocess
 from typing import Any
@@ -26,18 +29,26 @@ from . import CheckTest
 from .utils import config_section
 
 
+_MATCH_NOTHING = re.compile(r"a^")
+
+
 class TestListSessionsSockets:
+    @staticmethod
+    @pytest.fixture(scope="class")
+    def file_owner() -> str:
+        """Name of the user owning files created by the tests."""
+        return pwd.getpwuid(os.geteuid()).pw_name
+
     def test_empty(self, tmp_path: Path) -> None:
         assert list_sessions_sockets(tmp_path) == []
 
     @pytest.mark.parametrize("number", [0, 10, 1024])
-    def test_extracts_valid_sockets(self, tmp_path: Path, number: int) -> None:
-        session_sock = tmp_path / f"X{number}"
-        session_sock.touch()
+    def test_extracts_valid_sockets(
+        self, tmp_path: Path, number: int, file_owner: str
+    ) -> None:
+        (tmp_path / f"X{number}").touch()
 
-        assert list_sessions_sockets(tmp_path) == [
-            XorgSession(number, session_sock.owner())
-        ]
+        assert list_sessions_sockets(tmp_path) == [XorgSession(number, file_owner)]
 
     @pytest.mark.parametrize("invalid_number", ["", "string", "  "])
     def test_ignores_and_warns_on_invalid_numbers(
@@ -59,7 +70,7 @@ class TestListSessionsSockets:
         caplog: Any,
     ) -> None:
         (tmp_path / "X0").touch()
-        mocker.patch("pathlib.Path.owner").side_effect = KeyError()
+        mocker.patch("autosuspend.checks.xorg._user_name").side_effect = KeyError()
 
         with caplog.at_level(logging.WARNING):
             assert list_sessions_sockets(tmp_path) == []
@@ -79,6 +90,20 @@ class TestListSessionsSockets:
 
         assert len(list_sessions_sockets(tmp_path)) == 2
 
+    def test_missing_folder(self, tmp_path: Path) -> None:
+        assert list_sessions_sockets(tmp_path / "missing") == []
+
+    def test_folder_is_a_file(self, tmp_path: Path) -> None:
+        not_a_folder = tmp_path / "file"
+        not_a_folder.touch()
+
+        assert list_sessions_sockets(not_a_folder) == []
+
+    def test_ignores_dangling_symlinks(self, tmp_path: Path) -> None:
+        (tmp_path / "X0").symlink_to(tmp_path / "missing")
+
+        assert list_sessions_sockets(tmp_path) == []
+
 
 _LIST_LOGIND_SESSIONS_TO_PATCH = "autosuspend.checks.xorg.list_logind_sessions"
 
@@ -120,10 +145,10 @@ class TestListSessionsLogind:
 class TestXIdleTime(CheckTest):
     def create_instance(self, name: str) -> Check:
         # concrete values are never used in the test
-        return XIdleTime(name, 10, "sockets", None, None)  # type: ignore
+        return XIdleTime(name, 10, "sockets", None, None)
 
     def test_smoke(self, mocker: MockerFixture) -> None:
-        check = XIdleTime("name", 100, "logind", re.compile(r"a^"), re.compile(r"a^"))
+        check = XIdleTime("name", 100, "logind", _MATCH_NOTHING, _MATCH_NOTHING)
         mocker.patch.object(check, "_provide_sessions").return_value = [
             XorgSession(42, getuser()),
         ]
@@ -141,7 +166,7 @@ class TestXIdleTime(CheckTest):
         assert getuser() in kwargs["env"]["XAUTHORITY"]
 
     def test_no_activity(self, mocker: MockerFixture) -> None:
-        check = XIdleTime("name", 100, "logind", re.compile(r"a^"), re.compile(r"a^"))
+        check = XIdleTime("name", 100, "logind", _MATCH_NOTHING, _MATCH_NOTHING)
         mocker.patch.object(check, "_provide_sessions").return_value = [
             XorgSession(42, getuser()),
         ]
@@ -150,8 +175,21 @@ class TestXIdleTime(CheckTest):
 
         assert check.check() is None
 
+    def test_processes_are_not_listed_without_ignore_pattern(
+        self, mocker: MockerFixture
+    ) -> None:
+        check = XIdleTime("name", 100, "logind", None, None)
+        mocker.patch.object(check, "_provide_sessions").return_value = [
+            XorgSession(42, getuser()),
+        ]
+        mocker.patch("subprocess.check_output").return_value = "120000"
+        process_iter = mocker.patch("psutil.process_iter")
+
+        assert check.check() is None
+        process_iter.assert_not_called()
+
     def test_multiple_sessions(self, mocker: MockerFixture) -> None:
-        check = XIdleTime("name", 100, "logind", re.compile(r"a^"), re.compile(r"a^"))
+        check = XIdleTime("name", 100, "logind", _MATCH_NOTHING, _MATCH_NOTHING)
         mocker.patch.object(check, "_provide_sessions").return_value = [
             XorgSession(42, getuser()),
             XorgSession(17, "root"),
@@ -175,7 +213,7 @@ class TestXIdleTime(CheckTest):
         assert "root" in kwargs["env"]["XAUTHORITY"]
 
     def test_handle_call_error(self, mocker: MockerFixture) -> None:
-        check = XIdleTime("name", 100, "logind", re.compile(r"a^"), re.compile(r"a^"))
+        check = XIdleTime("name", 100, "logind", _MATCH_NOTHING, _MATCH_NOTHING)
         mocker.patch.object(check, "_provide_sessions").return_value = [
             XorgSession(42, getuser()),
         ]
@@ -190,8 +228,8 @@ class TestXIdleTime(CheckTest):
     def test_create_default(self) -> None:
         check = XIdleTime.create("name", config_section())
         assert check._timeout == 600
-        assert check._ignore_process_re == re.compile(r"a^")
-        assert check._ignore_users_re == re.compile(r"a^")
+        assert check._ignore_process_re is None
+        assert check._ignore_users_re is None
         assert check._provide_sessions == list_sessions_sockets
 
     def test_create(self) -> None:
@@ -211,21 +249,19 @@ class TestXIdleTime(CheckTest):
         assert check._ignore_users_re == re.compile(r"test.*test")
         assert check._provide_sessions == list_sessions_logind
 
-    def test_create_no_int(self) -> None:
-        with pytest.raises(ConfigurationError):
-            XIdleTime.create("name", config_section({"timeout": "string"}))
-
-    def test_create_broken_process_re(self) -> None:
-        with pytest.raises(ConfigurationError):
-            XIdleTime.create("name", config_section({"ignore_if_process": "[[a-9]"}))
-
-    def test_create_broken_users_re(self) -> None:
-        with pytest.raises(ConfigurationError):
-            XIdleTime.create("name", config_section({"ignore_users": "[[a-9]"}))
-
-    def test_create_unknown_method(self) -> None:
+    @pytest.mark.parametrize(
+        "config",
+        [
+            {"timeout": "string"},
+            {"ignore_if_process": "[[a-9]"},
+            {"ignore_users": "[[a-9]"},
+            {"method": "asdfasdf"},
+        ],
+        ids=["no_int", "broken_process_re", "broken_users_re", "unknown_method"],
+    )
+    def test_create_raises_with_invalid_config(self, config: Mapping[str, str]) -> None:
         with pytest.raises(ConfigurationError):
-            XIdleTime.create("name", config_section({"method": "asdfasdf"}))
+            XIdleTime.create("name", config_section(config))
 
     def test_list_sessions_logind_dbus_error(self, mocker: MockerFixture) -> None:
         check = XIdleTime.create("name", config_section())
@@ -237,7 +273,7 @@ class TestXIdleTime(CheckTest):
             check._safe_provide_sessions()
 
     def test_sudo_not_found(self, mocker: MockerFixture) -> None:
-        check = XIdleTime("name", 100, "logind", re.compile(r"a^"), re.compile(r"a^"))
+        check = XIdleTime("name", 100, "logind", _MATCH_NOTHING, _MATCH_NOTHING)
         mocker.patch.object(check, "_provide_sessions").return_value = [
             XorgSession(42, getuser()),
         ]
@@ -1,5 +1,6 @@
 from collections.abc import Iterable
 from datetime import datetime, timedelta, timezone
+import functools
 import logging
 from pathlib import Path
 from typing import Any
@@ -21,12 +22,17 @@ LOCK_FILE = "test-woke-up.lock"
 NOTIFY_FILE = "notify"
 
 
-def configure_config(config: str, datadir: Path, tmp_path: Path) -> Path:
+TEMPLATE_DIR = Path(__file__).with_suffix("")
+
+
+@functools.cache
+def _read_template(config: str) -> str:
+    return (TEMPLATE_DIR / config).read_text()
+
+
+def configure_config(config: str, tmp_path: Path) -> Path:
     out_path = tmp_path / config
-    with out_path.open("w") as out_config:
-        out_config.write(
-            (datadir / config).read_text().replace("@TMPDIR@", str(tmp_path)),
-        )
+    out_path.write_text(_read_template(config).replace("@TMPDIR@", str(tmp_path)))
     return out_path
 
 
@@ -41,11 +47,11 @@ def _rapid_sleep(mocker: MockerFixture) -> Iterable[None]:
 
 
 @pytest.mark.usefixtures("_rapid_sleep")
-def test_no_suspend_if_matching(datadir: Path, tmp_path: Path) -> None:
+def test_no_suspend_if_matching(tmp_path: Path) -> None:
     autosuspend.main(
         [
             "-c",
-            str(configure_config("dont_suspend.conf", datadir, tmp_path)),
+            str(configure_config("dont_suspend.conf", tmp_path)),
             "-d",
             "daemon",
             "-r",
@@ -57,11 +63,11 @@ def test_no_suspend_if_matching(datadir: Path, tmp_path: Path) -> None:
 
 
 @pytest.mark.usefixtures("_rapid_sleep")
-def test_suspend(tmp_path: Path, datadir: Path) -> None:
+def test_suspend(tmp_path: Path) -> None:
     autosuspend.main(
         [
             "-c",
-            str(configure_config("would_suspend.conf", datadir, tmp_path)),
+            str(configure_config("would_suspend.conf", tmp_path)),
             "-d",
             "daemon",
             "-r",
@@ -73,7 +79,7 @@ def test_suspend(tmp_path: Path, datadir: Path) -> None:
 
 
 @pytest.mark.usefixtures("_rapid_sleep")
-def test_wakeup_scheduled(tmp_path: Path, datadir: Path) -> None:
+def test_wakeup_scheduled(tmp_path: Path) -> None:
     # configure when to wake up
     now = datetime.now(timezone.utc)
     wakeup_at = now + timedelta(hours=4)
@@ -82,7 +88,7 @@ def test_wakeup_scheduled(tmp_path: Path, datadir: Path) -> None:
     autosuspend.main(
         [
             "-c",
-            str(configure_config("would_schedule.conf", datadir, tmp_path)),
+            str(configure_config("would_schedule.conf", tmp_path)),
             "-d",
             "daemon",
             "-r",
@@ -98,12 +104,12 @@ def test_wakeup_scheduled(tmp_path: Path, datadir: Path) -> None:
 
 
 @pytest.mark.usefixtures("_rapid_sleep")
-def test_woke_up_file_removed(tmp_path: Path, datadir: Path) -> None:
+def test_woke_up_file_removed(tmp_path: Path) -> None:
     (tmp_path / WOKE_UP_FILE).touch()
     autosuspend.main(
         [
             "-c",
-            str(configure_config("dont_suspend.conf", datadir, tmp_path)),
+            str(configure_config("dont_suspend.conf", tmp_path)),
             "-d",
             "daemon",
             "-r",
@@ -114,11 +120,11 @@ def test_woke_up_file_removed(tmp_path: Path, datadir: Path) -> None:
 
 
 @pytest.mark.usefixtures("_rapid_sleep")
-def test_notify_call(tmp_path: Path, datadir: Path) -> None:
+def test_notify_call(tmp_path: Path) -> None:
     autosuspend.main(
         [
             "-c",
-            str(configure_config("notify.conf", datadir, tmp_path)),
+            str(configure_config("notify.conf", tmp_path)),
             "-d",
             "daemon",
             "-r",
@@ -132,7 +138,7 @@ def test_notify_call(tmp_path: Path, datadir: Path) -> None:
 
 
 @pytest.mark.usefixtures("_rapid_sleep")
-def test_notify_call_wakeup(tmp_path: Path, datadir: Path) -> None:
+def test_notify_call_wakeup(tmp_path: Path) -> None:
     # configure when to wake up
     now = datetime.now(timezone.utc)
     wakeup_at = now + timedelta(hours=4)
@@ -141,7 +147,7 @@ def test_notify_call_wakeup(tmp_path: Path, datadir: Path) -> None:
     autosuspend.main(
         [
             "-c",
-            str(configure_config("notify_wakeup.conf", datadir, tmp_path)),
+            str(configure_config("notify_wakeup.conf", tmp_path)),
             "-d",
             "daemon",
             "-r",
@@ -156,12 +162,12 @@ def test_notify_call_wakeup(tmp_path: Path, datadir: Path) -> None:
     )
 
 
-def test_error_no_checks_configured(tmp_path: Path, datadir: Path) -> None:
+def test_error_no_checks_configured(tmp_path: Path) -> None:
     with pytest.raises(autosuspend.ConfigurationError):
         autosuspend.main(
             [
                 "-c",
-                str(configure_config("no_checks.conf", datadir, tmp_path)),
+                str(configure_config("no_checks.conf", tmp_path)),
                 "-d",
                 "daemon",
                 "-r",
@@ -171,11 +177,11 @@ def test_error_no_checks_configured(tmp_path: Path, datadir: Path) -> None:
 
 
 @pytest.mark.usefixtures("_rapid_sleep")
-def test_temporary_errors_logged(tmp_path: Path, datadir: Path, caplog: Any) -> None:
+def test_temporary_errors_logged(tmp_path: Path, caplog: Any) -> None:
     autosuspend.main(
         [
             "-c",
-            str(configure_config("temporary_error.conf", datadir, tmp_path)),
+            str(configure_config("temporary_error.conf", tmp_path)),
             "-d",
             "daemon",
             "-r",
@@ -192,14 +198,14 @@ def test_temporary_errors_logged(tmp_path: Path, datadir: Path, caplog: Any) ->
     assert len(warnings) > 0
 
 
-def test_loop_defaults(tmp_path: Path, datadir: Path, mocker: MockerFixture) -> None:
+def test_loop_defaults(tmp_path: Path, mocker: MockerFixture) -> None:
     loop = mocker.patch("autosuspend.loop")
     loop.side_effect = StopIteration
     with pytest.raises(StopIteration):
         autosuspend.main(
             [
                 "-c",
-                str(configure_config("minimal.conf", datadir, tmp_path)),
+                str(configure_config("minimal.conf", tmp_path)),
                 "-d",
                 "daemon",
                 "-r",
@@ -212,11 +218,11 @@ def test_loop_defaults(tmp_path: Path, datadir: Path, mocker: MockerFixture) ->
     assert kwargs["woke_up_file"] == Path("/var/run/autosuspend-just-woke-up")
 
 
-def test_hook_success(tmp_path: Path, datadir: Path) -> None:
+def test_hook_success(tmp_path: Path) -> None:
     autosuspend.main(
         [
             "-c",
-            str(configure_config("would_suspend.conf", datadir, tmp_path)),
+            str(configure_config("would_suspend.conf", tmp_path)),
             "-d",
             "presuspend",
         ]
@@ -225,7 +231,7 @@ def test_hook_success(tmp_path: Path, datadir: Path) -> None:
     assert (tmp_path / WOKE_UP_FILE).exists()
 
 
-def test_hook_call_wakeup(tmp_path: Path, datadir: Path) -> None:
+def test_hook_call_wakeup(tmp_path: Path) -> None:
     # configure when to wake up
     now = datetime.now(timezone.utc)
     wakeup_at = now + timedelta(hours=4)
@@ -234,7 +240,7 @@ def test_hook_call_wakeup(tmp_path: Path, datadir: Path) -> None:
     autosuspend.main(
         [
             "-c",
-            str(configure_config("would_schedule.conf", datadir, tmp_path)),
+            str(configure_config("would_schedule.conf", tmp_path)),
             "-d",
             "presuspend",
         ]
@@ -246,11 +252,11 @@ def test_hook_call_wakeup(tmp_path: Path, datadir: Path) -> None:
     )
 
 
-def test_version(tmp_path: Path, datadir: Path) -> None:
+def test_version(tmp_path: Path) -> None:
     autosuspend.main(
         [
             "-c",
-            str(configure_config("would_schedule.conf", datadir, tmp_path)),
+            str(configure_config("would_schedule.conf", tmp_path)),
             "version",
         ]
     )
@@ -1,5 +1,6 @@
 from collections.abc import Mapping
 import configparser
+import functools
 
 
 def config_section(
@@ -9,3 +10,15 @@ def config_section(
     section_name = "a_section"
     parser.read_dict({section_name: entries or {}})
     return parser[section_name]
+
+
+@functools.cache
+def config_parser(text: str) -> configparser.ConfigParser:
+    """Parse a configuration string.
+
+    Parsed configurations are shared between calls with the same text and must
+    not be modified.
+    """
+    parser = configparser.ConfigParser()
+    parser.read_string(text)
+    return parser